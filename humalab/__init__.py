@@ -12,8 +12,9 @@ Main components:
 - Metrics: Base class for tracking various metric types
 """
 
+import importlib
+
 from humalab.humalab import init, finish, login
-from humalab import assets
 from humalab import metrics
 from humalab import scenarios
 from humalab.run import Run
@@ -31,4 +32,14 @@ __all__ = [
     "MetricDimType",
     "GraphType",
 #    "evaluators",
-]
\ No newline at end of file
+]
+
+# Submodules that are only imported on first attribute access
+_LAZY_SUBMODULES = {"assets"}
+
+
+def __getattr__(name: str):
+    """Import lazily loaded submodules such as ``humalab.assets`` on first access."""
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -4,7 +4,7 @@ This module provides functionality for downloading and listing versioned resourc
 from HumaLab, including URDF robot descriptions, meshes, videos, and other data files.
 """
 
-from .resource_operator import download, list_resources
+from .resource_operator import download, download_many, list_resources
 from .files import ResourceFile, URDFFile
 
-__all__ = ["download", "list_resources", "ResourceFile", "URDFFile"]
\ No newline at end of file
+__all__ = ["download", "download_many", "list_resources", "ResourceFile", "URDFFile"]
\ No newline at end of file
@@ -18,6 +18,9 @@ class ResourceType(Enum):
     DATA = "data"
 
 
+_RESOURCE_TYPE_BY_VALUE = {rt.value: rt for rt in ResourceType}
+"""Lookup table from resource type string to ResourceType."""
+
 
 class ResourceFile:
     """Represents a resource file stored in HumaLab.
@@ -34,6 +37,14 @@ class ResourceFile:
         created_at (datetime | None): When the resource was created.
         description (str | None): Optional description of the resource.
     """
+    __slots__ = ("_project",
+                 "_name",
+                 "_version",
+                 "_filename",
+                 "_resource_type",
+                 "_description",
+                 "_created_at")
+
     def __init__(self, 
                  name: str, 
                  version: int, 
@@ -46,7 +57,8 @@ class ResourceFile:
         self._name = name
         self._version = version
         self._filename = filename
-        self._resource_type = ResourceType(resource_type)
+        # Fall back to the enum constructor for members and invalid values.
+        self._resource_type = _RESOURCE_TYPE_BY_VALUE.get(resource_type) or ResourceType(resource_type)
         self._description = description
         self._created_at = created_at
 
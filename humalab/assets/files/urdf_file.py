@@ -18,6 +18,8 @@ class URDFFile(ResourceFile):
         urdf_filename (str | None): Path to the main URDF file.
         root_path (str): Root directory containing the extracted URDF and assets.
     """
+    __slots__ = ("_urdf_base_filename", "_urdf_filename", "_root_path")
+
     def __init__(self, 
                  name: str, 
                  version: int,
@@ -1,12 +1,33 @@
 from humalab.constants import DEFAULT_PROJECT
 from humalab.assets.files.resource_file import ResourceFile, ResourceType
 from humalab.humalab_config import HumalabConfig
-from humalab.humalab_api_client import HumaLabApiClient
+from humalab.humalab_api_client import HumaLabApiClient, get_api_client
 from humalab.assets.files.urdf_file import URDFFile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+import json
 import os
+import threading
 from typing import Any, Optional
 
-        
+_RESOURCE_PAGE_SIZE = 100
+"""Maximum number of resources requested per page from the resources endpoint."""
+
+_MAX_PAGE_WORKERS = 8
+"""Maximum number of resource pages fetched concurrently."""
+
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+"""Size in bytes of the chunks streamed to disk when downloading a resource."""
+
+_RESOURCE_META_FILENAME = "resource.meta.json"
+"""Sidecar file recording the metadata of a completely downloaded asset version."""
+
+_download_locks: dict[str, threading.Lock] = {}
+"""Per asset directory locks, so one version is downloaded by one thread at a time."""
+_download_locks_lock = threading.Lock()
+
+
 def _asset_dir(humalab_config: HumalabConfig, name: str, version: int) -> str:
     """Get the local directory path for a specific asset version.
 
@@ -18,7 +39,59 @@ def _asset_dir(humalab_config: HumalabConfig, name: str, version: int) -> str:
     Returns:
         str: Path to the asset directory.
     """
-    return os.path.join(humalab_config.workspace_path, "assets", name, f"{version}")
+    return _workspace_asset_dir(humalab_config.workspace_path, name, version)
+
+@lru_cache(maxsize=1024)
+def _workspace_asset_dir(workspace_path: str, name: str, version: int) -> str:
+    """Get the asset directory path under a workspace.
+
+    Args:
+        workspace_path (str): The local workspace directory path.
+        name (str): Asset name.
+        version (int): Asset version.
+
+    Returns:
+        str: Path to the asset directory.
+    """
+    return os.path.join(workspace_path, "assets", name, f"{version}")
+
+def _load_resource_meta(asset_dir: str) -> dict | None:
+    """Load the metadata sidecar of a downloaded asset version.
+
+    The sidecar only counts if the downloaded file it records is still present
+    with the recorded size.
+
+    Args:
+        asset_dir (str): Path to the asset directory.
+
+    Returns:
+        dict | None: The resource metadata, or None if the asset has not been
+            completely downloaded or its file was removed or changed since.
+    """
+    try:
+        with open(os.path.join(asset_dir, _RESOURCE_META_FILENAME), "r") as f:
+            meta = json.load(f)
+        resource = meta["resource"]
+        if os.path.getsize(os.path.join(asset_dir, meta["filename"])) != meta["size"]:
+            return None
+        return resource
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def _save_resource_meta(asset_dir: str, resource: dict, filename: str, size: int) -> None:
+    """Atomically write the metadata sidecar of a downloaded asset version.
+
+    Args:
+        asset_dir (str): Path to the asset directory.
+        resource (dict): The resource metadata.
+        filename (str): Name of the downloaded file within asset_dir.
+        size (int): Size of the downloaded file in bytes.
+    """
+    meta_path = os.path.join(asset_dir, _RESOURCE_META_FILENAME)
+    tmp_path = f"{meta_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"resource": resource, "filename": filename, "size": size}, f)
+    os.replace(tmp_path, meta_path)
 
 def _create_asset_dir(humalab_config: HumalabConfig, name: str, version: int) -> bool:
     """Create the local directory for an asset if it doesn't exist.
@@ -31,11 +104,11 @@ def _create_asset_dir(humalab_config: HumalabConfig, name: str, version: int) ->
     Returns:
         bool: True if directory was created, False if it already existed.
     """
-    asset_dir = _asset_dir(humalab_config, name, version)
-    if not os.path.exists(asset_dir):
-        os.makedirs(asset_dir, exist_ok=True)
+    try:
+        Path(_asset_dir(humalab_config, name, version)).mkdir(parents=True)
         return True
-    return False
+    except FileExistsError:
+        return False
 
 def download(name: str,
              version: int | None=None,
@@ -60,18 +133,124 @@ def download(name: str,
     """
     humalab_config = HumalabConfig()
 
-    api_client = HumaLabApiClient(base_url=host,
-                                  api_key=api_key,
-                                  timeout=timeout)
-
-    resource = api_client.get_resource(project_name=project, name=name, version=version)
-    filename = os.path.basename(resource['resource_url'])
-    filename = os.path.join(_asset_dir(humalab_config, name, resource["version"]), filename)
-    if _create_asset_dir(humalab_config, name, resource["version"]):
-        file_content = api_client.download_resource(project_name=project, name="lerobot")
-        with open(filename, "wb") as f:
-            f.write(file_content)
-    
+    api_client = get_api_client(base_url=host,
+                                api_key=api_key,
+                                timeout=timeout)
+
+    return _download_one(api_client=api_client,
+                         humalab_config=humalab_config,
+                         name=name,
+                         version=version,
+                         project=project)
+
+def download_many(resources: list[str | tuple[str, int | None]],
+                  project: str = DEFAULT_PROJECT,
+                  max_workers: int = 8,
+
+                  host: str | None = None,
+                  api_key: str | None = None,
+                  timeout: float | None = None,
+                  ) -> list[Any]:
+    """Download several resources from HumaLab concurrently.
+
+    Repeated specs are downloaded once and share the returned file object.
+
+    Args:
+        resources (list[str | tuple[str, int | None]]): Resources to download, given
+            either as a name (latest version) or as a (name, version) tuple.
+        project (str): The project name. Defaults to DEFAULT_PROJECT.
+        max_workers (int): Maximum number of concurrent downloads. Defaults to 8.
+        host (str | None): Optional API host override.
+        api_key (str | None): Optional API key override.
+        timeout (float | None): Optional timeout override.
+
+    Returns:
+        list[ResourceFile | URDFFile]: The downloaded resource file objects, in the
+            same order as `resources`.
+    """
+    humalab_config = HumalabConfig()
+
+    api_client = get_api_client(base_url=host,
+                                api_key=api_key,
+                                timeout=timeout)
+
+    def download_spec(spec: tuple[str, int | None]) -> Any:
+        name, version = spec
+        return _download_one(api_client=api_client,
+                             humalab_config=humalab_config,
+                             name=name,
+                             version=version,
+                             project=project)
+
+    if not resources:
+        return []
+    specs = [(spec, None) if isinstance(spec, str) else tuple(spec) for spec in resources]
+    # Identical specs would write the same target file concurrently, so each
+    # (name, version) is downloaded once
+    unique_specs = list(dict.fromkeys(specs))
+    with ThreadPoolExecutor(max_workers=min(len(unique_specs), max_workers)) as executor:
+        downloaded = dict(zip(unique_specs, executor.map(download_spec, unique_specs)))
+    return [downloaded[spec] for spec in specs]
+
+def _download_lock(asset_dir: str) -> threading.Lock:
+    """Get the lock serializing downloads into an asset directory.
+
+    Args:
+        asset_dir (str): Path to the asset directory.
+
+    Returns:
+        threading.Lock: The lock for asset_dir.
+    """
+    with _download_locks_lock:
+        return _download_locks.setdefault(asset_dir, threading.Lock())
+
+def _download_one(api_client: HumaLabApiClient,
+                  humalab_config: HumalabConfig,
+                  name: str,
+                  version: int | None,
+                  project: str) -> Any:
+    """Download a single resource and wrap it in a resource file object.
+
+    Args:
+        api_client (HumaLabApiClient): API client instance.
+        humalab_config (HumalabConfig): Configuration containing workspace path.
+        name (str): The resource name to download.
+        version (int | None): Optional specific version. If None, downloads latest.
+        project (str): The project name.
+
+    Returns:
+        ResourceFile | URDFFile: The downloaded resource file object.
+    """
+    resource = None
+    if version is not None:
+        resource = _load_resource_meta(_asset_dir(humalab_config, name, version))
+    if resource is None:
+        # Pinned versions are served from the client's response cache after the first fetch
+        resource = api_client.get_resource(project_name=project, name=name, version=version)
+        asset_dir = _asset_dir(humalab_config, name, resource["version"])
+        # Specs such as (name, None) and (name, latest) resolve to the same directory;
+        # the first thread downloads and the others find its sidecar
+        with _download_lock(asset_dir):
+            downloaded = _load_resource_meta(asset_dir)
+            if downloaded is not None:
+                resource = downloaded
+            else:
+                _create_asset_dir(humalab_config, name, resource["version"])
+                chunks = api_client.stream_resource(project_name=project,
+                                                    name=name,
+                                                    version=resource["version"],
+                                                    chunk_size=_DOWNLOAD_CHUNK_SIZE)
+                basename = os.path.basename(resource['resource_url'])
+                size = 0
+                with open(os.path.join(asset_dir, basename), "wb") as f:
+                    for chunk in chunks:
+                        f.write(chunk)
+                        size += len(chunk)
+                _save_resource_meta(asset_dir, resource, basename, size)
+
+    filename = os.path.join(_asset_dir(humalab_config, name, resource["version"]),
+                            os.path.basename(resource['resource_url']))
+
     if resource["resource_type"].lower() == "urdf":
         return URDFFile(project=project,
                         name=name,
@@ -113,27 +292,76 @@ def list_resources(project: str = DEFAULT_PROJECT,
     Returns:
         list[ResourceFile]: List of resource file objects.
     """
-    api_client = HumaLabApiClient(base_url=host,
-                                  api_key=api_key,
-                                  timeout=timeout)
+    api_client = get_api_client(base_url=host,
+                                api_key=api_key,
+                                timeout=timeout)
 
     resource_type_string = None
     if resource_types:
-        resource_type_strings = {rt.value if isinstance(rt, ResourceType) else rt for rt in resource_types}
-        resource_type_string = ",".join(resource_type_strings)
-    resp = api_client.get_resources(project_name=project,
+        # dict.fromkeys drops duplicates while keeping the caller's order
+        resource_type_string = ",".join(dict.fromkeys(
+            rt.value if isinstance(rt, ResourceType) else rt for rt in resource_types))
+    resources = _get_resource_pages(api_client=api_client,
+                                    project=project,
                                     resource_types=resource_type_string,
                                     limit=limit,
                                     offset=offset,
                                     latest_only=latest_only)
-    resources = resp.get("resources", [])
-    ret_list = []
-    for resource in resources:
-        ret_list.append(ResourceFile(name=resource["name"],
-                                    version=resource.get("version"),
-                                    project=project,
-                                    filename=resource.get("filename"),
-                                    resource_type=resource.get("resource_type"),
-                                    description=resource.get("description"),
-                                    created_at=resource.get("created_at")))
-    return ret_list
\ No newline at end of file
+    # Positional arguments follow ResourceFile.__init__:
+    # (name, version, filename, resource_type, project, description, created_at)
+    return [ResourceFile(resource["name"],
+                         resource.get("version"),
+                         resource.get("filename"),
+                         resource.get("resource_type"),
+                         project,
+                         resource.get("description"),
+                         resource.get("created_at"))
+            for resource in resources]
+
+def _get_resource_pages(api_client: HumaLabApiClient,
+                        project: str,
+                        resource_types: str | None,
+                        limit: int,
+                        offset: int,
+                        latest_only: bool) -> list[dict]:
+    """Fetch up to `limit` resources starting at `offset`.
+
+    Requests larger than a single page are split into pages of
+    _RESOURCE_PAGE_SIZE. The first page is fetched on its own; if it is full,
+    the following pages are fetched concurrently in waves of _MAX_PAGE_WORKERS,
+    stopping after the wave that reaches a short page (the end of the catalog).
+
+    Args:
+        api_client (HumaLabApiClient): API client instance.
+        project (str): The project name.
+        resource_types (str | None): Comma-separated resource types to filter by.
+        limit (int): Maximum number of resources to return.
+        offset (int): Pagination offset.
+        latest_only (bool): Only return latest versions.
+
+    Returns:
+        list[dict]: The raw resource records.
+    """
+    def fetch_page(page_offset: int) -> list[dict]:
+        page_limit = min(_RESOURCE_PAGE_SIZE, offset + limit - page_offset)
+        resp = api_client.get_resources(project_name=project,
+                                        resource_types=resource_types,
+                                        limit=page_limit,
+                                        offset=page_offset,
+                                        latest_only=latest_only)
+        return resp.get("resources", [])
+
+    resources = fetch_page(offset)
+    if limit <= _RESOURCE_PAGE_SIZE or len(resources) < _RESOURCE_PAGE_SIZE:
+        return resources
+
+    page_offsets = range(offset + _RESOURCE_PAGE_SIZE, offset + limit, _RESOURCE_PAGE_SIZE)
+    with ThreadPoolExecutor(max_workers=min(len(page_offsets), _MAX_PAGE_WORKERS)) as executor:
+        for wave_start in range(0, len(page_offsets), _MAX_PAGE_WORKERS):
+            wave = page_offsets[wave_start:wave_start + _MAX_PAGE_WORKERS]
+            for page in executor.map(fetch_page, wave):
+                resources.extend(page)
+                if len(page) < _RESOURCE_PAGE_SIZE:
+                    # A short page marks the end of the catalog.
+                    return resources
+    return resources
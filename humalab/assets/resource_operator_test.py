@@ -0,0 +1,161 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+
+from humalab.assets import resource_operator
+
+
+def _resource(name: str, version: int) -> dict:
+    return {
+        "name": name,
+        "version": version,
+        "resource_type": "mesh",
+        "resource_url": f"https://files.humalab.test/{name}/{version}/{name}.obj",
+    }
+
+
+class ResourceOperatorTest(unittest.TestCase):
+    """Unit tests for resource download operations."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.workspace = tempfile.TemporaryDirectory()
+        self.api_client = MagicMock()
+        self.api_client.base_url = "http://humalab.test"
+        self.api_client.get_resource.side_effect = (
+            lambda project_name, name, version: _resource(name, version or 1))
+        self.api_client.stream_resource.side_effect = lambda **kwargs: iter([b"data"])
+
+        config = MagicMock()
+        config.workspace_path = self.workspace.name
+        patchers = [
+            patch("humalab.assets.resource_operator.get_api_client", return_value=self.api_client),
+            patch("humalab.assets.resource_operator.HumalabConfig", return_value=config),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Clean up after each test method."""
+        self.workspace.cleanup()
+
+    def _downloaded(self) -> list[tuple[str, int]]:
+        return [(c.kwargs["name"], c.kwargs["version"]) for c in self.api_client.stream_resource.call_args_list]
+
+    def test_download_many_should_download_repeated_specs_once(self):
+        """Test that identical specs are downloaded once and share the result."""
+        # In-test
+        files = resource_operator.download_many(["box", ("box", None), ("cup", 2), ("cup", 2)])
+
+        # Post-condition
+        self.assertEqual(len(files), 4)
+        self.assertIs(files[0], files[1])
+        self.assertIs(files[2], files[3])
+        self.assertEqual(sorted(self._downloaded()), [("box", 1), ("cup", 2)])
+
+    def test_download_many_should_download_latest_and_pinned_spec_once(self):
+        """Test that a latest spec and a pinned spec of the same version write the file once."""
+        # In-test
+        files = resource_operator.download_many([("box", None), ("box", 1)])
+
+        # Post-condition
+        self.assertEqual(files[0].filename, files[1].filename)
+        self.assertEqual(self._downloaded(), [("box", 1)])
+
+    def test_download_should_reuse_completed_download(self):
+        """Test that a completely downloaded version is served from disk without API calls."""
+        # Pre-condition
+        first = resource_operator.download("box", version=3)
+        self.api_client.reset_mock()
+
+        # In-test
+        second = resource_operator.download("box", version=3)
+
+        # Post-condition
+        self.assertEqual(second.filename, first.filename)
+        self.api_client.get_resource.assert_not_called()
+        self.api_client.stream_resource.assert_not_called()
+
+    def test_download_should_fetch_partial_download_again(self):
+        """Test that a version whose metadata sidecar is missing is downloaded again."""
+        # Pre-condition
+        first = resource_operator.download("box", version=3)
+        os.remove(os.path.join(os.path.dirname(first.filename), resource_operator._RESOURCE_META_FILENAME))
+        self.api_client.reset_mock()
+
+        # In-test
+        resource_operator.download("box", version=3)
+
+        # Post-condition
+        self.assertEqual(self._downloaded(), [("box", 3)])
+        self.assertTrue(os.path.exists(os.path.join(os.path.dirname(first.filename),
+                                                    resource_operator._RESOURCE_META_FILENAME)))
+
+    def _serve_catalog(self, size: int) -> None:
+        catalog = [_resource(f"r{i}", 1) for i in range(size)]
+        self.api_client.get_resources.side_effect = (
+            lambda project_name, resource_types, limit, offset, latest_only:
+                {"resources": catalog[offset:offset + limit]})
+
+    def test_list_resources_should_merge_pages_in_order(self):
+        """Test that a request spanning several pages returns the records in catalog order."""
+        # Pre-condition
+        self._serve_catalog(230)
+
+        # In-test
+        resources = resource_operator.list_resources(limit=250)
+
+        # Post-condition
+        self.assertEqual([r.name for r in resources], [f"r{i}" for i in range(230)])
+        offsets = sorted(c.kwargs["offset"] for c in self.api_client.get_resources.call_args_list)
+        self.assertEqual(offsets, [0, 100, 200])
+
+    def test_list_resources_should_stop_at_short_first_page(self):
+        """Test that a short first page ends the listing without fanning out."""
+        # Pre-condition
+        self._serve_catalog(30)
+
+        # In-test
+        resources = resource_operator.list_resources(limit=10000)
+
+        # Post-condition
+        self.assertEqual(len(resources), 30)
+        self.api_client.get_resources.assert_called_once()
+
+    def test_list_resources_should_stop_after_wave_with_short_page(self):
+        """Test that pages past the end of the catalog are requested at most one wave ahead."""
+        # Pre-condition
+        self._serve_catalog(150)
+
+        # In-test
+        resources = resource_operator.list_resources(limit=10000)
+
+        # Post-condition
+        self.assertEqual(len(resources), 150)
+        self.assertLessEqual(self.api_client.get_resources.call_count, 1 + resource_operator._MAX_PAGE_WORKERS)
+
+    def test_download_should_fetch_again_when_file_is_missing_or_changed(self):
+        """Test that a sidecar is ignored when its file was deleted or has a different size."""
+        for damage in ("delete", "truncate"):
+            with self.subTest(damage=damage):
+                # Pre-condition
+                first = resource_operator.download("box", version=3)
+                if damage == "delete":
+                    os.remove(first.filename)
+                else:
+                    open(first.filename, "wb").close()
+                self.api_client.reset_mock()
+
+                # In-test
+                second = resource_operator.download("box", version=3)
+
+                # Post-condition
+                self.assertEqual(self._downloaded(), [("box", 3)])
+                with open(second.filename, "rb") as f:
+                    self.assertEqual(f.read(), b"data")
+
+
+if __name__ == "__main__":
+    unittest.main()
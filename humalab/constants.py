@@ -3,15 +3,18 @@
 from enum import Enum
 
 
-RESERVED_NAMES = {
+RESERVED_NAMES = frozenset({
     "sceanario",
     "seed",
-}
+})
 """Set of reserved names that cannot be used for metric or artifact keys."""
 
 DEFAULT_PROJECT = "default"
 """Default project name used when no project is specified."""
 
+MAX_UPLOAD_WORKERS = 8
+"""Maximum number of artifact uploads issued concurrently when finishing."""
+
 
 class ArtifactType(Enum):
     """Types of artifacts that can be stored"""
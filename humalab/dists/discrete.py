@@ -28,8 +28,9 @@ class Discrete(Distribution):
             size (int | tuple[int, ...] | None): The size of the output.
         """
         super().__init__(generator=generator)
-        self._low = np.array(low)
-        self._high = np.array(high)
+        # Scalars are passed to the generator as-is; only sequences need an array.
+        self._low = low if isinstance(low, int) else np.asarray(low)
+        self._high = high if isinstance(high, int) else np.asarray(high)
         self._size = size
         self._endpoint = endpoint if endpoint is not None else True
     
@@ -26,8 +26,9 @@ class LogUniform(Distribution):
             size (int | tuple[int, ...]| None): The size of the output.
         """
         super().__init__(generator=generator)
-        self._log_low = np.log(np.array(low))
-        self._log_high = np.log(np.array(high))
+        # Scalars are passed to np.log as-is; only sequences need an array.
+        self._log_low = np.log(low if isinstance(low, (int, float)) else np.asarray(low))
+        self._log_high = np.log(high if isinstance(high, (int, float)) else np.asarray(high))
         self._size = size
     
     @staticmethod
@@ -67,7 +68,11 @@ class LogUniform(Distribution):
         Returns:
             int | float | np.ndarray: Sampled value(s) in log-space.
         """
-        return np.exp(self._generator.uniform(self._log_low, self._log_high, size=self._size))
+        samples = self._generator.uniform(self._log_low, self._log_high, size=self._size)
+        if isinstance(samples, np.ndarray):
+            # Exponentiate in place rather than allocating a second buffer.
+            return np.exp(samples, out=samples)
+        return np.exp(samples)
 
     def __repr__(self) -> str:
         """String representation of the log-uniform distribution.
@@ -1,14 +1,18 @@
-from humalab.constants import RESERVED_NAMES, ArtifactType
-from humalab.humalab_api_client import HumaLabApiClient, EpisodeStatus
+from humalab.constants import MAX_UPLOAD_WORKERS, RESERVED_NAMES, ArtifactType
+from humalab.humalab_api_client import EpisodeStatus, get_api_client
 from humalab.metrics.code import Code
 from humalab.metrics.summary import Summary
 from humalab.metrics.metric import Metrics
 from omegaconf import DictConfig, ListConfig, OmegaConf
+from omegaconf.errors import KeyValidationError, MissingMandatoryValue
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
-import pickle
 import traceback
 
-from humalab.utils import is_standard_type
+from humalab.utils import is_standard_type, pickle_artifact
+
+# Lookup failures that mean "not in the scenario", matching the containment check
+_MISSING_KEY_ERRORS = (KeyError, IndexError, KeyValidationError, MissingMandatoryValue)
 
 
 class Episode:
@@ -51,12 +55,14 @@ class Episode:
         self._episode_status = EpisodeStatus.RUNNING
         self._scenario_conf = scenario_conf
         self._logs = {}
+        # Metrics held in _logs, indexed separately so log() can dispatch without type checks
+        self._metric_logs: dict[str, Metrics] = {}
         self._episode_vals = episode_vals or {}
         self._is_finished = False
 
-        self._api_client = HumaLabApiClient(base_url=base_url,
-                                            api_key=api_key,
-                                            timeout=timeout)
+        self._api_client = get_api_client(base_url=base_url,
+                                          api_key=api_key,
+                                          timeout=timeout)
 
     @property
     def run_id(self) -> str:
@@ -140,9 +146,10 @@ class Episode:
         Raises:
             AttributeError: If the attribute is not in scenario configuration.
         """
-        if name in self._scenario_conf:
+        try:
             return self._scenario_conf[name]
-        raise AttributeError(f"'Scenario' object has no attribute '{name}'")
+        except _MISSING_KEY_ERRORS:
+            raise AttributeError(f"'Scenario' object has no attribute '{name}'") from None
 
     def __getitem__(self, key: Any) -> Any:
         """Access scenario configuration values using subscript notation.
@@ -158,9 +165,10 @@ class Episode:
         Raises:
             KeyError: If the key is not in scenario configuration.
         """
-        if key in self._scenario_conf:
+        try:
             return self._scenario_conf[key]
-        raise KeyError(f"'Scenario' object has no key '{key}'")
+        except _MISSING_KEY_ERRORS:
+            raise KeyError(f"'Scenario' object has no key '{key}'") from None
 
     def add_metric(self, name: str, metric: Metrics) -> None:
         """Add a metric to track for this episode.
@@ -175,6 +183,7 @@ class Episode:
         if name in self._logs:
             raise ValueError(f"{name} is a reserved name and is not allowed.")
         self._logs[name] = metric
+        self._metric_logs[name] = metric
     
     def log_code(self, key: str, code_content: str) -> None:
         """Log code content as an artifact.
@@ -185,6 +194,7 @@ class Episode:
         """
         if key in RESERVED_NAMES:
             raise ValueError(f"{key} is a reserved name and is not allowed.")
+        self._metric_logs.pop(key, None)
         self._logs[key] = Code(
             run_id=self._run_id,
             key=key,
@@ -203,21 +213,22 @@ class Episode:
         Raises:
             ValueError: If a key is reserved or logging fails.
         """
+        metric_logs = self._metric_logs
+        get_metric = metric_logs.get
+        # x is loop-invariant, so resolve the per-key x lookup once
+        get_x = (x or {}).get
         for key, value in data.items():
             if key in RESERVED_NAMES:
                 raise ValueError(f"{key} is a reserved name and is not allowed.")
-            if key not in self._logs:
+            metric = get_metric(key)
+            if metric is not None:
+                metric.log(value, x=get_x(key), replace=replace)
+            elif key not in self._logs or replace:
                 self._logs[key] = value
+                if isinstance(value, Metrics):
+                    metric_logs[key] = value
             else:
-                cur_val = self._logs[key]
-                if isinstance(cur_val, Metrics):
-                    cur_x = x.get(key) if x is not None else None
-                    cur_val.log(value, x=cur_x, replace=replace)
-                else:
-                    if replace:
-                        self._logs[key] = value
-                    else:
-                        raise ValueError(f"Cannot log value for key '{key}' as there is already a value logged.")
+                raise ValueError(f"Cannot log value for key '{key}' as there is already a value logged.")
 
     @property
     def yaml(self) -> str:
@@ -252,52 +263,62 @@ class Episode:
         self._is_finished = True
         self._episode_status = status
 
-        self._api_client.upload_code(
-            artifact_key="scenario",
-            run_id=self._run_id,
-            episode_id=self._episode_id,
-            code_content=self.yaml
-        )
+        # Artifact uploads are independent, so overlap their round trips.
+        with ThreadPoolExecutor(max_workers=MAX_UPLOAD_WORKERS) as executor:
+            futures = [executor.submit(
+                self._api_client.upload_code,
+                artifact_key="scenario",
+                run_id=self._run_id,
+                episode_id=self._episode_id,
+                code_content=self.yaml
+            )]
+
+            # TODO: submit final metrics
+            for key, value in self._logs.items():
+                if isinstance(value, Summary):
+                    metric_val = value.finalize()
+                    pickled = pickle_artifact(metric_val["value"])
+                    futures.append(executor.submit(
+                        self._api_client.upload_python,
+                        artifact_key=key,
+                        run_id=self._run_id,
+                        episode_id=self._episode_id,
+                        pickled_bytes=pickled
+                    ))
+                elif isinstance(value, Metrics):
+                    metric_val = value.finalize()
+                    pickled = pickle_artifact(metric_val)
+                    futures.append(executor.submit(
+                        self._api_client.upload_metrics,
+                        artifact_key=key,
+                        run_id=self._run_id,
+                        episode_id=self._episode_id,
+                        pickled_bytes=pickled,
+                        graph_type=value.graph_type.value,
+                    ))
+                elif isinstance(value, Code):
+                    futures.append(executor.submit(
+                        self._api_client.upload_code,
+                        artifact_key=value.key,
+                        run_id=value.run_id,
+                        episode_id=value.episode_id,
+                        code_content=value.code_content
+                    ))
+                else:
+                    if not is_standard_type(value):
+                        raise ValueError(f"Value for key '{key}' is not a standard type.")
+                    pickled = pickle_artifact(value)
+                    futures.append(executor.submit(
+                        self._api_client.upload_python,
+                        artifact_key=key,
+                        run_id=self._run_id,
+                        episode_id=self._episode_id,
+                        pickled_bytes=pickled
+                    ))
+
+            for future in futures:
+                future.result()
 
-        # TODO: submit final metrics
-        for key, value in self._logs.items():
-            if isinstance(value, Summary):
-                metric_val = value.finalize()
-                pickled = pickle.dumps(metric_val["value"])
-                self._api_client.upload_python(
-                    artifact_key=key,
-                    run_id=self._run_id,
-                    episode_id=self._episode_id,
-                    pickled_bytes=pickled
-                )
-            elif isinstance(value, Metrics):
-                metric_val = value.finalize()
-                pickled = pickle.dumps(metric_val)
-                self._api_client.upload_metrics(
-                    artifact_key=key,
-                    run_id=self._run_id,
-                    episode_id=self._episode_id,
-                    pickled_bytes=pickled,
-                    graph_type=value.graph_type.value,
-                )
-            elif isinstance(value, Code):
-                self._api_client.upload_code(
-                    artifact_key=value.key,
-                    run_id=value.run_id,
-                    episode_id=value.episode_id,
-                    code_content=value.code_content
-                )
-            else:
-                if not is_standard_type(value):
-                    raise ValueError(f"Value for key '{key}' is not a standard type.")
-                pickled = pickle.dumps(value)
-                self._api_client.upload_python(
-                    artifact_key=key,
-                    run_id=self._run_id,
-                    episode_id=self._episode_id,
-                    pickled_bytes=pickled
-                )
-        
         self._api_client.update_episode(
             run_id=self._run_id,
             episode_id=self._episode_id,
@@ -0,0 +1,52 @@
+import unittest
+from unittest.mock import patch, MagicMock
+
+from omegaconf import OmegaConf
+
+from humalab.episode import Episode
+from humalab.humalab_api_client import EpisodeStatus
+from humalab.metrics.metric import Metrics
+from humalab.metrics.summary import Summary
+
+
+class EpisodeTest(unittest.TestCase):
+    """Unit tests for Episode."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.api_client = MagicMock()
+        with patch("humalab.episode.get_api_client", return_value=self.api_client):
+            self.episode = Episode(run_id="run_id",
+                                   episode_id="episode_id",
+                                   scenario_conf=OmegaConf.create({"a": 1}))
+        self.episode.add_metric("reward", Metrics())
+        self.episode.add_metric("best", Summary("max"))
+        self.episode.log({"reward": 1.0, "best": 2.0, "note": "text"})
+
+    def test_finish_should_upload_every_artifact(self):
+        """Test that finish() submits all artifacts before updating the episode."""
+        # In-test
+        self.episode.finish(status=EpisodeStatus.SUCCESS)
+
+        # Post-condition
+        upload_python_keys = {c.kwargs["artifact_key"] for c in self.api_client.upload_python.call_args_list}
+        self.assertEqual(upload_python_keys, {"best", "note"})
+        self.assertEqual(self.api_client.upload_code.call_args.kwargs["artifact_key"], "scenario")
+        self.assertEqual(self.api_client.upload_metrics.call_args.kwargs["artifact_key"], "reward")
+        self.api_client.update_episode.assert_called_once()
+
+    def test_finish_should_raise_upload_errors(self):
+        """Test that an exception raised by an upload worker reaches the caller."""
+        # Pre-condition
+        self.api_client.upload_python.side_effect = ConnectionError("boom")
+
+        # In-test
+        with self.assertRaises(ConnectionError):
+            self.episode.finish(status=EpisodeStatus.SUCCESS)
+
+        # Post-condition
+        self.api_client.update_episode.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
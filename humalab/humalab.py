@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 import sys
 import traceback
@@ -7,7 +8,7 @@ from omegaconf import OmegaConf
 from humalab.constants import DEFAULT_PROJECT
 from humalab.run import Run
 from humalab.humalab_config import HumalabConfig
-from humalab.humalab_api_client import HumaLabApiClient, RunStatus, EpisodeStatus
+from humalab.humalab_api_client import HumaLabApiClient, RunStatus, EpisodeStatus, clear_api_clients, get_api_client
 import requests
 
 import uuid
@@ -35,15 +36,13 @@ def _pull_scenario(client: HumaLabApiClient,
         str | list | dict | None: The scenario configuration.
     """
     if scenario_id is not None:
-        scenario_arr = scenario_id.split(":")
-        if len(scenario_arr) < 1:
-            raise ValueError("Invalid scenario_id format. Expected 'scenario_id' or 'scenario_name:version'.")
-        scenario_real_id = scenario_arr[0]
-        scenario_version = int(scenario_arr[1]) if len(scenario_arr) > 1 else None
+        scenario_real_id, sep, version_str = scenario_id.partition(":")
+        scenario_version = int(version_str) if sep else None
 
+        # Pinned versions are served from the client's response cache after the first fetch
         scenario_response = client.get_scenario(
             project_name=project,
-            uuid=scenario_real_id, 
+            uuid=scenario_real_id,
             version=scenario_version)
         final_scenario = scenario_response["yaml_content"]
     else:
@@ -102,17 +101,46 @@ def init(project: str | None = None,
         description = description or ""
         id = id or str(uuid.uuid4())
 
-        api_client = HumaLabApiClient(base_url=base_url,
-                                      api_key=api_key,
-                                      timeout=timeout)
+        api_client = get_api_client(base_url=base_url,
+                                    api_key=api_key,
+                                    timeout=timeout)
         scenario_inst = _pull_scenario(client=api_client, 
                                         project=project,
                                         seed=seed,
                                         scenario=scenario, 
                                         scenario_id=scenario_id)
-        
-        project_resp = api_client.create_project(name=project)
-        
+
+        # Project creation is independent of looking up the run, so once the
+        # scenario has been pulled, overlap the two round trips.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            project_future = executor.submit(api_client.create_project, name=project)
+            try:
+                run_response = api_client.get_run(run_id=id)
+                # Only write back when the existing run differs from what was requested.
+                # The API may return null for an unset name, description or tags, which
+                # is equivalent to the empty defaults used here.
+                if (run_response.get("status") != RunStatus.RUNNING.value
+                        or (run_response.get("name") or "") != name
+                        or (run_response.get("description") or "") != description
+                        or (tags is not None and (run_response.get("tags") or []) != tags)):
+                    api_client.update_run(
+                        run_id=run_response['run_id'],
+                        name=name,
+                        description=description,
+                        tags=tags,
+                        status=RunStatus.RUNNING,
+                    )
+
+            except requests.HTTPError as e:
+                if e.response.status_code == 404:
+                    # If not found then create a new run,
+                    # so ignore not found error.
+                    run_response = None
+                else:
+                    # Otherwise re-raise the exception.
+                    raise
+            project_resp = project_future.result()
+
         if scenario_id is None and scenario is not None and auto_create_scenario:
             scenario_response = api_client.create_scenario(
                 project_name=project_resp['name'],
@@ -121,24 +149,6 @@ def init(project: str | None = None,
                 yaml_content=OmegaConf.to_yaml(scenario_inst.template),
             )
             scenario_id = scenario_response['uuid']
-        try:
-            run_response = api_client.get_run(run_id=id)
-            api_client.update_run(
-                run_id=run_response['run_id'],
-                name=name,
-                description=description,
-                tags=tags,
-                status=RunStatus.RUNNING,
-            )
-
-        except requests.HTTPError as e:
-            if e.response.status_code == 404:
-                # If not found then create a new run,
-                # so ignore not found error.
-                run_response = None
-            else:
-                # Otherwise re-raise the exception.
-                raise
 
         if run_response is None:
             run_response = api_client.create_run(name=name,
@@ -146,10 +156,6 @@ def init(project: str | None = None,
                                                  description=description,
                                                  tags=tags)
             id = run_response['run_id']
-            api_client.update_run(
-                run_id=id,
-                description=description,
-            )
 
         run = Run(
             project=project_resp['name'],
@@ -216,4 +222,6 @@ def login(api_key: str | None = None,
     humalab_config.api_key = api_key or humalab_config.api_key
     humalab_config.base_url = host or humalab_config.base_url
     humalab_config.timeout = timeout or humalab_config.timeout
+    # Shared API clients resolve their defaults from the config at creation.
+    clear_api_clients()
     return True
@@ -1,12 +1,149 @@
 """HTTP client for accessing HumaLab service APIs with API key authentication."""
 
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
+import json
+import math
 import os
+import threading
+import time
+import uuid
 import requests
-from typing import Dict, Any, Optional, List
-from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from typing import BinaryIO, Callable, Dict, Any, Iterable, Iterator, Optional, List, Tuple
+from urllib3.util.retry import Retry
 from humalab.humalab_config import HumalabConfig
 
+try:
+    import orjson       # faster JSON encoding/decoding
+except ImportError:
+    orjson = None
+
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder    # streaming multipart bodies
+except ImportError:
+    MultipartEncoder = None
+
+
+_RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+"""Retry policy for transient failures. Only idempotent methods (GET, PUT, DELETE, ...)
+are retried on status codes; the final response is returned so raise_for_status
+reports it as before."""
+
+
+_DEFAULT_MAX_CONNECTIONS = 16
+"""Default keep-alive pool size; covers the SDK's own 8-worker upload and bulk pools."""
+
+_MAX_BULK_WORKERS = 8
+"""Maximum number of requests the bulk helpers keep in flight at once."""
+
+def _has_non_finite(value: Any) -> bool:
+    """Whether a JSON-bound value contains a NaN or infinite float, including in numpy arrays."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(v) for v in value)
+    if hasattr(value, "dtype") and hasattr(value, "tolist"):
+        return _has_non_finite(value.tolist())
+    return False
+
+
+def _dump_json(data: Any) -> Optional[bytes]:
+    """Encode a request body with orjson, or return None to let requests encode it.
+
+    orjson writes NaN and infinity as null, so, like requests' own encoder, reject
+    them instead of silently sending different values.
+
+    Raises:
+        requests.exceptions.InvalidJSONError: If data contains a NaN or infinite float
+    """
+    if orjson is None or data is None:
+        return None
+    try:
+        body = orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        return None
+    if b"null" in body and _has_non_finite(data):
+        raise requests.exceptions.InvalidJSONError("Out of range float values are not JSON compliant")
+    return body
+
+
+def _parse_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, with orjson when it is installed.
+
+    Bodies orjson rejects are decoded again by requests, so malformed JSON raises the
+    same requests.exceptions.JSONDecodeError and NaN literals are accepted either way.
+    """
+    if orjson is None:
+        return response.json()
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        return response.json()
+
+
+def _load_json(content: bytes) -> Any:
+    """Decode a raw JSON body, with orjson when it is installed.
+
+    Bodies orjson rejects are decoded again with the json module, so errors and NaN
+    literals behave the same either way.
+    """
+    if orjson is None:
+        return json.loads(content)
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return json.loads(content)
+
+
+_GET_CACHE_SIZE = 512
+"""Maximum number of immutable GET responses kept per client."""
+
+_GET_CACHE_TTL = 60.0
+"""Seconds a cached GET response stays valid."""
+
+def _request_key(endpoint: str, params: Optional[Dict[str, Any]]) -> tuple:
+    """Hashable identity of a GET request: the endpoint and its sorted params."""
+    return (endpoint, tuple(sorted(params.items())) if params else ())
+
+
+def _write_chunks(chunks: Iterable[bytes], dest: str | os.PathLike | BinaryIO) -> int:
+    """Write streamed chunks to a path or binary file object and return the byte count.
+
+    A path is written through a temporary file next to it and only replaced once the
+    stream completes, so a failed download never leaves a truncated file behind. A file
+    object is written in place and keeps whatever chunks arrived before the failure.
+    """
+    if isinstance(dest, (str, os.PathLike)):
+        tmp_path = f"{os.fspath(dest)}.{uuid.uuid4().hex}.part"
+        try:
+            with open(tmp_path, "wb") as f:
+                written = _write_chunks(chunks, f)
+            os.replace(tmp_path, dest)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return written
+    written = 0
+    for chunk in chunks:
+        dest.write(chunk)
+        written += len(chunk)
+    return written
+
+
+_FORM_HEADERS = {"Content-Type": None}
+"""Per-request header override that removes the session's JSON Content-Type."""
+
 
 class RunStatus(Enum):
     """Status of runs"""
@@ -32,7 +169,8 @@ class HumaLabApiClient:
         self,
         base_url: str | None = None,
         api_key: str | None = None,
-        timeout: float | None = None
+        timeout: float | None = None,
+        max_connections: int = _DEFAULT_MAX_CONNECTIONS
     ):
         """
         Initialize the HumaLab API client.
@@ -41,6 +179,8 @@ class HumaLabApiClient:
             base_url: Base URL for the HumaLab service (defaults to https://api.humalab.ai)
             api_key: API key for authentication (defaults to HUMALAB_API_KEY env var)
             timeout: Request timeout in seconds
+            max_connections: Size of the keep-alive connection pool; callers issuing
+                requests from a thread pool should set this to at least their worker count
         """
         humalab_config = HumalabConfig()
         self.base_url = base_url or humalab_config.base_url or os.getenv("HUMALAB_SERVICE_URL", "https://api.humalab.ai")
@@ -55,15 +195,47 @@ class HumaLabApiClient:
                 "API key is required. Set HUMALAB_API_KEY environment variable "
                 "or pass api_key parameter to HumaLabApiClient constructor."
             )
-    
-    def _get_headers(self) -> Dict[str, str]:
-        """Get common headers for API requests."""
-        return {
+
+        # Reuse pooled keep-alive connections across requests; transient connection
+        # failures and overload responses are retried with exponential backoff
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_connections,
+                              pool_maxsize=max_connections,
+                              max_retries=_RETRY_POLICY)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        # Common headers are sent with every request made through the session
+        self._session.headers.update({
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
             "User-Agent": "HumaLab-SDK/1.0"
-        }
+        })
+        self._url_prefix = self.base_url + "/"
+
+        # Responses for immutable resources, keyed by (endpoint, sorted params)
+        self._get_cache: OrderedDict[tuple, tuple[float, bytes]] = OrderedDict()
+        self._get_cache_lock = threading.Lock()
+        # GETs currently on the wire, so concurrent identical calls share one response
+        self._inflight: Dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the underlying session and release its pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "HumaLabApiClient":
+        """Enter the client context."""
+        return self
+
+    def __exit__(self, exception_type, exception_value, exception_traceback) -> None:
+        """Exit the client context and close the session."""
+        self.close()
     
+    def _url(self, endpoint: str) -> str:
+        """Build the absolute URL for an API endpoint relative to base_url."""
+        assert "://" not in endpoint, f"Endpoint must be a relative path: {endpoint}"
+        return self._url_prefix + endpoint.lstrip('/')
+
     def _make_request(
         self,
         method: str,
@@ -90,39 +262,35 @@ class HumaLabApiClient:
         Raises:
             requests.exceptions.RequestException: For HTTP errors
         """
-        url = urljoin(self.base_url + "/", endpoint.lstrip('/'))
-        headers = self._get_headers()
-        
-        # If files are being uploaded, don't set Content-Type (let requests handle it)
-        if files:
-            headers.pop("Content-Type", None)
+        url = self._url(endpoint)
         
         # Determine if we should send form data or JSON
         # Form data endpoints: /artifacts/code, /artifacts/blob/upload, /artifacts/python
         is_form_endpoint = any(form_path in endpoint for form_path in ['/artifacts/code', '/artifacts/blob', '/artifacts/python'])
         
         if is_form_endpoint or files:
-            # Send as form data
-            headers.pop("Content-Type", None)  # Let requests set multipart/form-data
-            response = requests.request(
+            # Send as form data; dropping the session Content-Type lets requests
+            # set the form/multipart one
+            response = self._session.request(
                 method=method,
                 url=url,
                 data=data,
                 params=params,
                 files=files,
-                headers=headers,
+                headers=_FORM_HEADERS,
                 timeout=self.timeout,
                 **kwargs
             )
         else:
-            # Send as JSON (default behavior)
-            response = requests.request(
+            # Send as JSON (default behavior); the session already sets the JSON Content-Type
+            body = _dump_json(data)
+            response = self._session.request(
                 method=method,
                 url=url,
-                json=data,
+                data=body,
+                json=data if body is None else None,
                 params=params,
                 files=files,
-                headers=headers,
                 timeout=self.timeout,
                 **kwargs
             )
@@ -132,6 +300,128 @@ class HumaLabApiClient:
         
         return response
     
+    def _post_file(
+        self,
+        endpoint: str,
+        file_path: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> requests.Response:
+        """
+        POST a file from disk as the 'file' field of a multipart form.
+
+        requests builds the whole multipart body in memory before sending it. When
+        requests-toolbelt is installed, the body is streamed from disk instead so
+        memory stays flat for large resources and videos.
+
+        Args:
+            endpoint: API endpoint (will be joined with base_url)
+            file_path: Path to the file to upload
+            data: Additional form fields
+            params: Query parameters
+
+        Returns:
+            requests.Response object
+        """
+        with open(file_path, 'rb') as f:
+            if MultipartEncoder is None:
+                return self.post(endpoint, files={'file': f}, data=data, params=params)
+            fields = {key: str(value) for key, value in (data or {}).items()}
+            fields['file'] = (os.path.basename(file_path), f)
+            encoder = MultipartEncoder(fields=fields)
+            response = self._session.post(
+                self._url(endpoint),
+                data=encoder,
+                params=params,
+                headers={"Content-Type": encoder.content_type},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            return response
+
+    def _get_cached(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        GET an endpoint whose response does not change, serving repeats from a TTL cache.
+
+        Responses marked 'Cache-Control: no-store' are not cached. The raw body is
+        cached and decoded on every call, so callers own (and may mutate) the result.
+
+        Args:
+            endpoint: API endpoint (will be joined with base_url)
+            params: Query parameters
+
+        Returns:
+            The decoded JSON response
+        """
+        key = _request_key(endpoint, params)
+        now = time.monotonic()
+        with self._get_cache_lock:
+            entry = self._get_cache.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._get_cache.move_to_end(key)
+                else:
+                    del self._get_cache[key]
+                    entry = None
+        if entry is not None:
+            return _load_json(entry[1])
+
+        response = self._get_shared(endpoint, params=params)
+        content = response.content
+        value = _load_json(content)
+        if "no-store" not in response.headers.get("Cache-Control", ""):
+            with self._get_cache_lock:
+                self._get_cache[key] = (now + _GET_CACHE_TTL, content)
+                self._get_cache.move_to_end(key)
+                if len(self._get_cache) > _GET_CACHE_SIZE:
+                    self._get_cache.popitem(last=False)
+        return value
+
+    def clear_cache(self) -> None:
+        """Drop all cached GET responses."""
+        with self._get_cache_lock:
+            self._get_cache.clear()
+
+    def _get_shared(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """
+        GET an endpoint, sharing one request between concurrent identical calls.
+
+        The first caller for a given endpoint and params makes the request; callers
+        arriving while it is in flight wait for and receive the same response (or
+        exception). Each caller decodes the body itself, so no decoded value is shared.
+        A joined request may have started before the caller's own writes, so this is
+        only used for immutable resources (see _get_cached).
+
+        Args:
+            endpoint: API endpoint (will be joined with base_url)
+            params: Query parameters
+
+        Returns:
+            The response object
+        """
+        key = _request_key(endpoint, params)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                leader = False
+            else:
+                leader = True
+                future = self._inflight[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            response = self.get(endpoint, params=params)
+        except BaseException as e:
+            with self._inflight_lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+        with self._inflight_lock:
+            del self._inflight[key]
+        future.set_result(response)
+        return response
+
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> requests.Response:
         """Make a GET request."""
         return self._make_request("GET", endpoint, params=params, **kwargs)
@@ -163,7 +453,7 @@ class HumaLabApiClient:
             User information from the validated token
         """
         response = self.get("/auth/validate")
-        return response.json()
+        return _parse_json(response)
 
     # Convenience methods for common API operations
     
@@ -198,7 +488,7 @@ class HumaLabApiClient:
             params["resource_types"] = resource_types
 
         response = self.get("/resources", params=params)
-        return response.json()
+        return _parse_json(response)
     
     def get_resource(self, name: str, project_name: str, version: Optional[int] = None) -> Dict[str, Any]:
         """
@@ -213,14 +503,11 @@ class HumaLabApiClient:
             Resource data
         """
         if version is not None:
-            endpoint = f"/resources/{name}/{version}"
-            params = {"project_name": project_name}
-        else:
-            endpoint = f"/resources/{name}"
-            params = {"project_name": project_name}
+            # A pinned version never changes
+            return self._get_cached(f"/resources/{name}/{version}", params={"project_name": project_name})
 
-        response = self.get(endpoint, params=params)
-        return response.json()
+        response = self.get(f"/resources/{name}", params={"project_name": project_name})
+        return _parse_json(response)
     
     def download_resource(
         self,
@@ -246,6 +533,62 @@ class HumaLabApiClient:
 
         response = self.get(endpoint, params=params)
         return response.content
+
+    def stream_resource(
+        self,
+        name: str,
+        project_name: str,
+        version: Optional[int] = None,
+        chunk_size: int = 1 << 20
+    ) -> Iterator[bytes]:
+        """
+        Download a resource file as a stream of chunks.
+
+        Unlike download_resource, the file is never held in memory as a whole.
+
+        Args:
+            name: Resource name
+            project_name: Project name (required)
+            version: Optional specific version (defaults to latest)
+            chunk_size: Maximum size of each chunk in bytes
+
+        Returns:
+            Iterator over the resource file content
+        """
+        endpoint = f"/resources/{name}/download"
+        params = {"project_name": project_name}
+        if version is not None:
+            params["version"] = str(version)
+
+        response = self.get(endpoint, params=params, stream=True)
+        with response:
+            yield from response.iter_content(chunk_size=chunk_size)
+
+    def download_resource_to(
+        self,
+        name: str,
+        project_name: str,
+        dest: str | os.PathLike | BinaryIO,
+        version: Optional[int] = None,
+        chunk_size: int = 1 << 20
+    ) -> int:
+        """
+        Download a resource file straight into a file without buffering it in memory.
+
+        Args:
+            name: Resource name
+            project_name: Project name (required)
+            dest: Path to write to, replaced only once the download completes,
+                or a binary file object to write into
+            version: Optional specific version (defaults to latest)
+            chunk_size: Maximum size of each chunk in bytes
+
+        Returns:
+            Number of bytes written
+        """
+        return _write_chunks(
+            self.stream_resource(name=name, project_name=project_name, version=version, chunk_size=chunk_size),
+            dest)
     
     def upload_resource(
         self,
@@ -272,27 +615,24 @@ class HumaLabApiClient:
         Returns:
             Created resource data
         """
-        with open(file_path, 'rb') as f:
-            files = {'file': f}
-            data = {}
-            if description:
-                data['description'] = description
-            if filename:
-                data['filename'] = filename
-
-            params = {
-                'resource_type': resource_type,
-                'project_name': project_name,
-                'allow_duplicate_name': allow_duplicate_name
-            }
-
-            response = self.post(f"/resources/{name}/upload", files=files, params=params)
-            return response.json()
+        data = {}
+        if description:
+            data['description'] = description
+        if filename:
+            data['filename'] = filename
+
+        params = {
+            'resource_type': resource_type,
+            'project_name': project_name,
+            'allow_duplicate_name': allow_duplicate_name
+        }
+
+        response = self._post_file(f"/resources/{name}/upload", file_path, data=data, params=params)
+        return _parse_json(response)
     
     def get_resource_types(self) -> List[str]:
         """Get list of all available resource types."""
-        response = self.get("/resources/types")
-        return response.json()
+        return self._get_cached("/resources/types")
 
     def get_scenarios(
         self,
@@ -329,7 +669,7 @@ class HumaLabApiClient:
             params["status_filter"] = status_filter
 
         response = self.get("/scenarios", params=params)
-        return response.json()
+        return _parse_json(response)
     
     def get_scenario(self, uuid: str, project_name: str, version: Optional[int] = None) -> Dict[str, Any]:
         """
@@ -346,10 +686,12 @@ class HumaLabApiClient:
         endpoint = f"/scenarios/{uuid}"
         params = {"project_name": project_name}
         if version is not None:
+            # A pinned version never changes
             params["scenario_version"] = str(version)
+            return self._get_cached(endpoint, params=params)
 
         response = self.get(endpoint, params=params)
-        return response.json()
+        return _parse_json(response)
 
     def create_scenario(
         self,
@@ -383,7 +725,7 @@ class HumaLabApiClient:
             data["yaml_content"] = yaml_content
 
         response = self.post("/scenarios", data=data)
-        return response.json()
+        return _parse_json(response)
 
     # Run CI API methods
     
@@ -403,7 +745,7 @@ class HumaLabApiClient:
             data["description"] = description
             
         response = self.post("/projects", data=data)
-        return response.json()
+        return _parse_json(response)
     
     def get_projects(
         self, 
@@ -422,7 +764,7 @@ class HumaLabApiClient:
         """
         params = {"limit": limit, "offset": offset}
         response = self.get("/projects", params=params)
-        return response.json()
+        return _parse_json(response)
     
     def get_project(self, name: str) -> Dict[str, Any]:
         """
@@ -435,7 +777,7 @@ class HumaLabApiClient:
             Project data
         """
         response = self.get(f"/projects/{name}")
-        return response.json()
+        return _parse_json(response)
     
     def update_project(self, name: str, description: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -453,7 +795,7 @@ class HumaLabApiClient:
             data["description"] = description
 
         response = self.put(f"/projects/{name}", data=data)
-        return response.json()
+        return _parse_json(response)
     
     def create_run(
         self, 
@@ -483,11 +825,11 @@ class HumaLabApiClient:
             "tags": tags or [],
             "status": RunStatus.RUNNING.value
         }
-        if description:
+        if description is not None:
             data["description"] = description
             
         response = self.post("/runs", data=data)
-        return response.json()
+        return _parse_json(response)
     
     def get_runs(
         self,
@@ -520,7 +862,7 @@ class HumaLabApiClient:
             params["tags"] = ",".join(tags)
             
         response = self.get("/runs", params=params)
-        return response.json()
+        return _parse_json(response)
     
     def get_run(self, run_id: str) -> Dict[str, Any]:
         """
@@ -533,8 +875,21 @@ class HumaLabApiClient:
             Run data
         """
         response = self.get(f"/runs/{run_id}")
-        return response.json()
+        return _parse_json(response)
     
+    def get_runs_bulk(self, run_ids: Iterable[str], max_workers: int = _MAX_BULK_WORKERS) -> List[Dict[str, Any]]:
+        """
+        Get several runs concurrently.
+
+        Args:
+            run_ids: Run IDs to fetch
+            max_workers: Maximum number of requests in flight
+
+        Returns:
+            Run data for each ID, in the order given
+        """
+        return self._map_concurrently(self.get_run, [(run_id,) for run_id in run_ids], max_workers)
+
     def update_run(
         self,
         run_id: str,
@@ -575,7 +930,7 @@ class HumaLabApiClient:
             data["tags"] = tags
 
         response = self.put(f"/runs/{run_id}", data=data)
-        return response.json()
+        return _parse_json(response)
     
     def create_episode(
         self, 
@@ -602,7 +957,7 @@ class HumaLabApiClient:
             data["status"] = status.value
             
         response = self.post("/episodes", data=data)
-        return response.json()
+        return _parse_json(response)
     
     def get_episodes(
         self,
@@ -630,7 +985,7 @@ class HumaLabApiClient:
             params["status"] = status.value
             
         response = self.get("/episodes", params=params)
-        return response.json()
+        return _parse_json(response)
     
     def get_episode(self, run_id: str, episode_id: str) -> Dict[str, Any]:
         """
@@ -644,7 +999,7 @@ class HumaLabApiClient:
             Episode data
         """
         response = self.get(f"/episodes/{run_id}/{episode_id}")
-        return response.json()
+        return _parse_json(response)
     
     def update_episode(
         self,
@@ -671,7 +1026,7 @@ class HumaLabApiClient:
         if err_msg is not None:
             data["err_msg"] = err_msg
         response = self.put(f"/episodes/{run_id}/{episode_id}", data=data)
-        return response.json()
+        return _parse_json(response)
     
     def delete_episode(self, run_id: str, episode_id: str) -> None:
         """
@@ -723,15 +1078,13 @@ class HumaLabApiClient:
             form_data['content_type'] = content_type
 
         if file_path:
-            with open(file_path, 'rb') as f:
-                files = {'file': f}
-                response = self.post("/artifacts/blob/upload", files=files, data=form_data)
+            response = self._post_file("/artifacts/blob/upload", file_path, data=form_data)
         elif file_content:
             files = {'file': ('blob', file_content)}
             response = self.post("/artifacts/blob/upload", files=files, data=form_data)
         else:
             raise ValueError("Either file_path or file_content must be provided for blob upload.")
-        return response.json()
+        return _parse_json(response)
     
     def upsert_metrics(
         self,
@@ -765,7 +1118,7 @@ class HumaLabApiClient:
             data["metric_data"] = metric_data
 
         response = self.post("/artifacts/metrics", data=data)
-        return response.json()
+        return _parse_json(response)
     
     def get_artifacts(
         self,
@@ -797,7 +1150,7 @@ class HumaLabApiClient:
             params["artifact_type"] = artifact_type
 
         response = self.get("/artifacts", params=params)
-        return response.json()
+        return _parse_json(response)
     
     def get_artifact(
         self,
@@ -817,7 +1170,7 @@ class HumaLabApiClient:
             Artifact data
         """
         response = self.get(f"/artifacts/{run_id}/{episode_id}/{artifact_key}")
-        return response.json()
+        return _parse_json(response)
 
     def upload_code(
         self,
@@ -847,7 +1200,7 @@ class HumaLabApiClient:
             data['episode_id'] = episode_id
 
         response = self.post("/artifacts/code", data=data)
-        return response.json()
+        return _parse_json(response)
 
     def upload_python(
         self,
@@ -877,7 +1230,7 @@ class HumaLabApiClient:
 
         files = {'file': pickled_bytes}
         response = self.post("/artifacts/python", files=files, data=data)
-        return response.json()
+        return _parse_json(response)
 
     def upload_scenario_stats_artifact(
         self,
@@ -909,7 +1262,7 @@ class HumaLabApiClient:
 
         files = {'file': pickled_bytes}
         response = self.post("/artifacts/scenario_stats", files=files, data=data)
-        return response.json()
+        return _parse_json(response)
 
     def download_artifact(
         self,
@@ -932,6 +1285,86 @@ class HumaLabApiClient:
         response = self.get(endpoint)
         return response.content
 
+    def stream_artifact(
+        self,
+        run_id: str,
+        episode_id: str,
+        artifact_key: str,
+        chunk_size: int = 1 << 20
+    ) -> Iterator[bytes]:
+        """
+        Download a blob artifact file as a stream of chunks.
+
+        Unlike download_artifact, the file is never held in memory as a whole.
+
+        Args:
+            run_id: Run ID
+            episode_id: Episode ID
+            artifact_key: Artifact key
+            chunk_size: Maximum size of each chunk in bytes
+
+        Returns:
+            Iterator over the artifact file content
+        """
+        endpoint = f"/artifacts/{run_id}/{episode_id}/{artifact_key}/download"
+        response = self.get(endpoint, stream=True)
+        with response:
+            yield from response.iter_content(chunk_size=chunk_size)
+
+    def download_artifact_to(
+        self,
+        run_id: str,
+        episode_id: str,
+        artifact_key: str,
+        dest: str | os.PathLike | BinaryIO,
+        chunk_size: int = 1 << 20
+    ) -> int:
+        """
+        Download a blob artifact file straight into a file without buffering it in memory.
+
+        Args:
+            run_id: Run ID
+            episode_id: Episode ID
+            artifact_key: Artifact key
+            dest: Path to write to, replaced only once the download completes,
+                or a binary file object to write into
+            chunk_size: Maximum size of each chunk in bytes
+
+        Returns:
+            Number of bytes written
+        """
+        return _write_chunks(
+            self.stream_artifact(run_id=run_id, episode_id=episode_id, artifact_key=artifact_key, chunk_size=chunk_size),
+            dest)
+
+    def download_artifacts_bulk(
+        self,
+        artifacts: Iterable[Tuple[str, str, str]],
+        max_workers: int = _MAX_BULK_WORKERS
+    ) -> List[bytes]:
+        """
+        Download several blob artifact files concurrently.
+
+        Args:
+            artifacts: (run_id, episode_id, artifact_key) tuples to download
+            max_workers: Maximum number of requests in flight
+
+        Returns:
+            Artifact file contents as bytes, in the order given
+        """
+        return self._map_concurrently(self.download_artifact, list(artifacts), max_workers)
+
+    def _map_concurrently(self, fn: Callable[..., Any], args_list: List[tuple], max_workers: int) -> List[Any]:
+        """Call fn for each argument tuple over the pooled session, preserving order.
+
+        If any call fails, the exception of the earliest failing call in input order
+        is raised and calls that have not started yet are cancelled.
+        """
+        if len(args_list) <= 1:
+            return [fn(*args) for args in args_list]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(args_list))) as executor:
+            return list(executor.map(lambda args: fn(*args), args_list))
+
     def upload_metrics(
         self,
         run_id: str,
@@ -963,4 +1396,61 @@ class HumaLabApiClient:
             data["episode_id"] = episode_id
 
         response = self.post("/artifacts/metrics", files=files, data=data)
-        return response.json()
+        return _parse_json(response)
+
+
+_API_CLIENT_CACHE_SIZE = 8
+"""Maximum number of shared API clients kept open at once."""
+
+_api_clients: "OrderedDict[tuple, HumaLabApiClient]" = OrderedDict()
+_api_clients_lock = threading.Lock()
+
+
+def get_api_client(
+    base_url: str | None = None,
+    api_key: str | None = None,
+    timeout: float | None = None,
+    max_connections: int = _DEFAULT_MAX_CONNECTIONS
+) -> HumaLabApiClient:
+    """
+    Get a shared HumaLab API client for the given connection settings.
+
+    Clients are cached per (base_url, api_key, timeout, max_connections) so
+    that their pooled connections are reused across calls. The least recently
+    used client is closed once more than _API_CLIENT_CACHE_SIZE are cached.
+
+    Args:
+        base_url: Base URL for the HumaLab service
+        api_key: API key for authentication
+        timeout: Request timeout in seconds
+        max_connections: Size of the keep-alive connection pool
+
+    Returns:
+        The shared HumaLabApiClient instance
+    """
+    key = (base_url, api_key, timeout, max_connections)
+    evicted = None
+    with _api_clients_lock:
+        client = _api_clients.get(key)
+        if client is not None:
+            _api_clients.move_to_end(key)
+            return client
+        client = _api_clients[key] = HumaLabApiClient(base_url=base_url, api_key=api_key, timeout=timeout,
+                                                      max_connections=max_connections)
+        if len(_api_clients) > _API_CLIENT_CACHE_SIZE:
+            _, evicted = _api_clients.popitem(last=False)
+    if evicted is not None:
+        evicted.close()
+    return client
+
+
+def clear_api_clients() -> None:
+    """Close and forget every shared API client.
+
+    The next get_api_client call creates a new client from the current config.
+    """
+    with _api_clients_lock:
+        clients = list(_api_clients.values())
+        _api_clients.clear()
+    for client in clients:
+        client.close()
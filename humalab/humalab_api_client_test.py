@@ -0,0 +1,513 @@
+import io
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch, MagicMock, Mock
+
+import numpy as np
+import requests
+
+from humalab.humalab_api_client import HumaLabApiClient, _GET_CACHE_TTL, _dump_json, _load_json, _parse_json, orjson
+from humalab.humalab_api_client import clear_api_clients, get_api_client
+
+
+def _response(body, headers: dict | None = None) -> Mock:
+    response = Mock()
+    response.content = json.dumps(body).encode()
+    response.json.side_effect = lambda: json.loads(response.content)
+    response.headers = headers or {}
+    return response
+
+
+def _stream_response(chunks: list, error: Exception | None = None) -> MagicMock:
+    def iter_content(chunk_size):
+        yield from chunks
+        if error is not None:
+            raise error
+
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.iter_content.side_effect = iter_content
+    return response
+
+
+class HumaLabApiClientTest(unittest.TestCase):
+    """Unit tests for HumaLabApiClient response caching."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.client = HumaLabApiClient(base_url="http://humalab.test", api_key="test_key")
+
+    def tearDown(self):
+        """Clean up after each test method."""
+        self.client.close()
+
+    def test_get_scenario_should_fetch_pinned_version_once(self):
+        """Test that a pinned scenario version is fetched from the API only once."""
+        # Pre-condition
+        body = {"uuid": "sid", "yaml_content": "scenario: pinned"}
+
+        with patch.object(self.client, "get", return_value=_response(body)) as mock_get:
+            # In-test
+            first = self.client.get_scenario(uuid="sid", project_name="proj", version=2)
+            second = self.client.get_scenario(uuid="sid", project_name="proj", version=2)
+
+        # Post-condition
+        self.assertEqual(first, body)
+        self.assertEqual(second, body)
+        mock_get.assert_called_once_with("/scenarios/sid",
+                                         params={"project_name": "proj", "scenario_version": "2"})
+
+    def test_cached_response_should_not_be_shared_between_callers(self):
+        """Test that mutating a cached result does not affect later callers."""
+        # Pre-condition
+        with patch.object(self.client, "get", return_value=_response(["urdf", "mjcf"])):
+            first = self.client.get_resource_types()
+
+            # In-test
+            first.append("mutated")
+            second = self.client.get_resource_types()
+
+        # Post-condition
+        self.assertEqual(second, ["urdf", "mjcf"])
+        self.assertIsNot(first, second)
+
+    def test_upload_resource_should_send_form_fields(self):
+        """Test that upload_resource sends description and filename as form fields."""
+        # Pre-condition
+        with patch.object(self.client, "_post_file", return_value=_response({"name": "box"})) as mock_post_file:
+            # In-test
+            self.client.upload_resource(name="box",
+                                        file_path="/tmp/box.urdf",
+                                        resource_type="urdf",
+                                        project_name="proj",
+                                        description="A box",
+                                        filename="box.urdf")
+
+        # Post-condition
+        mock_post_file.assert_called_once_with(
+            "/resources/box/upload",
+            "/tmp/box.urdf",
+            data={"description": "A box", "filename": "box.urdf"},
+            params={"resource_type": "urdf", "project_name": "proj", "allow_duplicate_name": False},
+        )
+
+    def test_cached_response_should_expire_after_ttl(self):
+        """Test that a cached response is fetched again once its TTL has passed."""
+        # Pre-condition
+        now = [1000.0]
+        mock_time = Mock()
+        mock_time.monotonic.side_effect = lambda: now[0]
+
+        with patch("humalab.humalab_api_client.time", mock_time), \
+                patch.object(self.client, "get", return_value=_response(["urdf"])) as mock_get:
+            self.client.get_resource_types()
+
+            # In-test
+            now[0] += _GET_CACHE_TTL - 1
+            self.client.get_resource_types()
+            calls_before_expiry = mock_get.call_count
+            now[0] += 2
+            self.client.get_resource_types()
+
+        # Post-condition
+        self.assertEqual(calls_before_expiry, 1)
+        self.assertEqual(mock_get.call_count, 2)
+
+    def test_cache_should_evict_least_recently_used_response(self):
+        """Test that the least recently used response is evicted when the cache is full."""
+        # Pre-condition
+        def fetch(version: int) -> None:
+            self.client.get_scenario(uuid="sid", project_name="proj", version=version)
+
+        with patch("humalab.humalab_api_client._GET_CACHE_SIZE", 2), \
+                patch.object(self.client, "get", return_value=_response({"yaml_content": ""})) as mock_get:
+            fetch(1)
+            fetch(2)
+            fetch(1)    # version 1 becomes the most recently used
+
+            # In-test
+            fetch(3)    # evicts version 2
+            mock_get.reset_mock()
+            fetch(1)
+            fetch(2)
+
+        # Post-condition
+        mock_get.assert_called_once_with("/scenarios/sid",
+                                         params={"project_name": "proj", "scenario_version": "2"})
+
+    def _concurrent_gets(self, get_side_effect, fetch=None, num_callers: int = 4) -> tuple[list, list, Mock]:
+        """Run concurrent identical calls while the first GET is held open.
+
+        By default the calls fetch a pinned scenario version, an immutable resource.
+        """
+        fetch = fetch or (lambda: self.client.get_scenario(uuid="sid", project_name="proj", version=2))
+        entered = threading.Event()
+        release = threading.Event()
+
+        def held_get(*args, **kwargs):
+            entered.set()
+            release.wait(5)
+            return get_side_effect()
+
+        results, errors = [], []
+
+        def call():
+            try:
+                results.append(fetch())
+            except Exception as e:
+                errors.append(e)
+
+        with patch.object(self.client, "get", side_effect=held_get) as mock_get:
+            leader = threading.Thread(target=call)
+            leader.start()
+            entered.wait(5)
+            followers = [threading.Thread(target=call) for _ in range(num_callers - 1)]
+            for thread in followers:
+                thread.start()
+            time.sleep(0.1)     # let the followers join the in-flight request
+            release.set()
+            for thread in [leader, *followers]:
+                thread.join(5)
+        return results, errors, mock_get
+
+    def test_concurrent_identical_gets_should_share_one_request(self):
+        """Test that concurrent identical GETs are coalesced into one request."""
+        # In-test
+        results, errors, mock_get = self._concurrent_gets(lambda: _response({"yaml_content": "latest"}))
+
+        # Post-condition
+        self.assertEqual(errors, [])
+        self.assertEqual(results, [{"yaml_content": "latest"}] * 4)
+        mock_get.assert_called_once()
+        # Each caller decodes its own copy
+        self.assertEqual(len({id(result) for result in results}), 4)
+
+    def test_concurrent_identical_gets_should_all_receive_the_error(self):
+        """Test that a failed shared GET raises in every waiting caller, and is not cached."""
+        # Pre-condition
+        def fail():
+            raise ConnectionError("boom")
+
+        # In-test
+        results, errors, mock_get = self._concurrent_gets(fail)
+
+        # Post-condition
+        self.assertEqual(results, [])
+        self.assertEqual(len(errors), 4)
+        self.assertTrue(all(isinstance(e, ConnectionError) for e in errors))
+        mock_get.assert_called_once()
+        self.assertEqual(self.client._inflight, {})
+
+    def test_concurrent_gets_of_mutable_entities_should_not_be_shared(self):
+        """Test that run lookups are never joined to a request already in flight."""
+        # Pre-condition
+        entered = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def held_get(endpoint, params=None):
+            calls.append(endpoint)
+            if len(calls) == 1:
+                entered.set()
+                release.wait(5)
+            return _response({"run_id": "rid", "name": f"call {len(calls)}"})
+
+        with patch.object(self.client, "get", side_effect=held_get):
+            first = []
+            leader = threading.Thread(target=lambda: first.append(self.client.get_run("rid")))
+            leader.start()
+            entered.wait(5)
+
+            # In-test
+            second = self.client.get_run("rid")
+            release.set()
+            leader.join(5)
+
+        # Post-condition
+        self.assertEqual(calls, ["/runs/rid", "/runs/rid"])
+        self.assertEqual(second["name"], "call 2")
+
+    def test_get_runs_bulk_should_return_runs_in_input_order(self):
+        """Test that bulk run lookups keep the input order regardless of completion order."""
+        # Pre-condition
+        delays = {"r1": 0.15, "r2": 0.0, "r3": 0.05}
+
+        def get_run(run_id):
+            time.sleep(delays[run_id])
+            return {"run_id": run_id}
+
+        with patch.object(self.client, "get_run", side_effect=get_run):
+            # In-test
+            runs = self.client.get_runs_bulk(["r1", "r2", "r3"])
+
+        # Post-condition
+        self.assertEqual([run["run_id"] for run in runs], ["r1", "r2", "r3"])
+
+    def test_get_runs_bulk_should_raise_first_worker_error(self):
+        """Test that the error of the earliest failing input is raised, even if a later one fails first."""
+        # Pre-condition
+        def get_run(run_id):
+            if run_id == "r2":
+                time.sleep(0.1)
+                raise KeyError(run_id)
+            if run_id == "r3":
+                raise ValueError(run_id)
+            return {"run_id": run_id}
+
+        with patch.object(self.client, "get_run", side_effect=get_run):
+            # In-test / Post-condition
+            with self.assertRaises(KeyError):
+                self.client.get_runs_bulk(["r1", "r2", "r3"])
+
+    def test_download_artifacts_bulk_should_return_contents_in_input_order(self):
+        """Test that bulk artifact downloads keep the input order regardless of completion order."""
+        # Pre-condition
+        artifacts = [("run", "ep1", "video"), ("run", "ep2", "video"), ("run", "ep3", "video")]
+        delays = {"ep1": 0.15, "ep2": 0.0, "ep3": 0.05}
+
+        def download_artifact(run_id, episode_id, artifact_key):
+            time.sleep(delays[episode_id])
+            return episode_id.encode()
+
+        with patch.object(self.client, "download_artifact", side_effect=download_artifact):
+            # In-test
+            contents = self.client.download_artifacts_bulk(artifacts)
+
+        # Post-condition
+        self.assertEqual(contents, [b"ep1", b"ep2", b"ep3"])
+
+    def test_download_artifacts_bulk_should_raise_worker_error(self):
+        """Test that a failed artifact download is raised to the caller."""
+        # Pre-condition
+        artifacts = [("run", "ep1", "video"), ("run", "ep2", "video")]
+
+        def download_artifact(run_id, episode_id, artifact_key):
+            if episode_id == "ep2":
+                raise ConnectionError("boom")
+            return b""
+
+        with patch.object(self.client, "download_artifact", side_effect=download_artifact):
+            # In-test / Post-condition
+            with self.assertRaises(ConnectionError):
+                self.client.download_artifacts_bulk(artifacts)
+
+    def test_stream_resource_should_yield_response_chunks(self):
+        """Test that stream_resource yields the chunks of a streamed GET and closes the response."""
+        # Pre-condition
+        response = _stream_response([b"ab", b"cd"])
+
+        with patch.object(self.client, "get", return_value=response) as mock_get:
+            # In-test
+            chunks = list(self.client.stream_resource(name="box", project_name="proj", version=3, chunk_size=2))
+
+        # Post-condition
+        self.assertEqual(chunks, [b"ab", b"cd"])
+        mock_get.assert_called_once_with("/resources/box/download",
+                                         params={"project_name": "proj", "version": "3"},
+                                         stream=True)
+        response.iter_content.assert_called_once_with(chunk_size=2)
+        response.__exit__.assert_called_once()
+
+    def test_download_resource_to_should_write_chunks_to_path(self):
+        """Test that download_resource_to writes every chunk to the destination path."""
+        # Pre-condition
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                patch.object(self.client, "get", return_value=_stream_response([b"ab", b"cd"])):
+            dest = os.path.join(tmp_dir, "box.urdf")
+
+            # In-test
+            written = self.client.download_resource_to(name="box", project_name="proj", dest=dest)
+
+            # Post-condition
+            self.assertEqual(written, 4)
+            with open(dest, "rb") as f:
+                self.assertEqual(f.read(), b"abcd")
+            self.assertEqual(os.listdir(tmp_dir), ["box.urdf"])
+
+    def test_download_resource_to_should_not_leave_partial_file_on_error(self):
+        """Test that a stream failing midway leaves neither a truncated file nor a temporary one."""
+        # Pre-condition
+        response = _stream_response([b"ab"], error=ConnectionError("boom"))
+
+        with tempfile.TemporaryDirectory() as tmp_dir, patch.object(self.client, "get", return_value=response):
+            dest = os.path.join(tmp_dir, "box.urdf")
+
+            # In-test
+            with self.assertRaises(ConnectionError):
+                self.client.download_resource_to(name="box", project_name="proj", dest=dest)
+
+            # Post-condition
+            self.assertEqual(os.listdir(tmp_dir), [])
+
+    def test_download_resource_to_should_keep_existing_file_on_error(self):
+        """Test that a failed download does not clobber a file already at the destination."""
+        # Pre-condition
+        response = _stream_response([b"ab"], error=ConnectionError("boom"))
+
+        with tempfile.TemporaryDirectory() as tmp_dir, patch.object(self.client, "get", return_value=response):
+            dest = os.path.join(tmp_dir, "box.urdf")
+            with open(dest, "wb") as f:
+                f.write(b"previous")
+
+            # In-test
+            with self.assertRaises(ConnectionError):
+                self.client.download_resource_to(name="box", project_name="proj", dest=dest)
+
+            # Post-condition
+            with open(dest, "rb") as f:
+                self.assertEqual(f.read(), b"previous")
+
+    def test_stream_artifact_should_yield_response_chunks(self):
+        """Test that stream_artifact yields the chunks of a streamed GET."""
+        # Pre-condition
+        with patch.object(self.client, "get", return_value=_stream_response([b"vi", b"deo"])) as mock_get:
+            # In-test
+            chunks = list(self.client.stream_artifact(run_id="run", episode_id="ep", artifact_key="video"))
+
+        # Post-condition
+        self.assertEqual(chunks, [b"vi", b"deo"])
+        mock_get.assert_called_once_with("/artifacts/run/ep/video/download", stream=True)
+
+    def test_download_artifact_to_should_write_chunks_to_file_object(self):
+        """Test that download_artifact_to writes every chunk into a file object."""
+        # Pre-condition
+        dest = io.BytesIO()
+
+        with patch.object(self.client, "get", return_value=_stream_response([b"vi", b"deo"])):
+            # In-test
+            written = self.client.download_artifact_to(run_id="run", episode_id="ep", artifact_key="video", dest=dest)
+
+        # Post-condition
+        self.assertEqual(written, 5)
+        self.assertEqual(dest.getvalue(), b"video")
+
+    def test_download_artifact_to_should_keep_received_chunks_in_file_object_on_error(self):
+        """Test that a file object keeps the chunks written before a mid-stream failure."""
+        # Pre-condition
+        dest = io.BytesIO()
+        response = _stream_response([b"vi"], error=ConnectionError("boom"))
+
+        with patch.object(self.client, "get", return_value=response):
+            # In-test
+            with self.assertRaises(ConnectionError):
+                self.client.download_artifact_to(run_id="run", episode_id="ep", artifact_key="video", dest=dest)
+
+        # Post-condition
+        self.assertEqual(dest.getvalue(), b"vi")
+        response.__exit__.assert_called_once()
+
+
+class JsonCodecTest(unittest.TestCase):
+    """Unit tests for the JSON encoding and decoding helpers, with or without orjson."""
+
+    def _requests_response(self, content: bytes) -> requests.Response:
+        response = requests.Response()
+        response._content = content
+        response.encoding = "utf-8"
+        return response
+
+    @unittest.skipUnless(orjson, "requests' own encoder handles bodies when orjson is missing")
+    def test_dump_json_should_reject_non_finite_floats(self):
+        """Test that NaN and infinity are rejected like requests' encoder, not sent as null."""
+        # Pre-condition
+        bodies = [{"value": float("nan")}, [1.0, float("inf")], {"values": np.array([1.0, np.nan])}]
+
+        for body in bodies:
+            # In-test / Post-condition
+            with self.assertRaises(requests.exceptions.InvalidJSONError):
+                _dump_json(body)
+
+    def test_dump_json_should_encode_none_as_null(self):
+        """Test that genuine None values still encode as null."""
+        # In-test
+        body = _dump_json({"value": None, "values": [1.0, None]})
+
+        # Post-condition
+        if body is not None:
+            self.assertEqual(json.loads(body), {"value": None, "values": [1.0, None]})
+
+    def test_parse_json_should_raise_requests_decode_error(self):
+        """Test that malformed JSON raises requests' JSONDecodeError on every decoding path."""
+        # Pre-condition
+        response = self._requests_response(b"{not json")
+
+        # In-test / Post-condition
+        with self.assertRaises(requests.exceptions.JSONDecodeError):
+            _parse_json(response)
+        with self.assertRaises(json.JSONDecodeError):
+            _load_json(b"{not json")
+
+    def test_parse_json_should_accept_nan_literals(self):
+        """Test that NaN literals decode the same way the json module decodes them."""
+        # In-test
+        parsed = _parse_json(self._requests_response(b'{"value": NaN}'))
+        loaded = _load_json(b'{"value": Infinity}')
+
+        # Post-condition
+        self.assertTrue(math.isnan(parsed["value"]))
+        self.assertEqual(loaded["value"], float("inf"))
+
+
+class GetApiClientTest(unittest.TestCase):
+    """Unit tests for the shared API client cache."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        clear_api_clients()
+
+    def tearDown(self):
+        """Clean up after each test method."""
+        clear_api_clients()
+
+    def _client(self, api_key: str) -> HumaLabApiClient:
+        return get_api_client(base_url="http://humalab.test", api_key=api_key, timeout=1.0)
+
+    def test_get_api_client_should_share_client_per_settings(self):
+        """Test that the same connection settings return the same client."""
+        # In-test
+        first = self._client("key_a")
+        second = self._client("key_a")
+        other = self._client("key_b")
+
+        # Post-condition
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+
+    def test_get_api_client_should_close_evicted_client(self):
+        """Test that the least recently used client is closed when the cache is full."""
+        # Pre-condition
+        with patch("humalab.humalab_api_client._API_CLIENT_CACHE_SIZE", 2), \
+                patch.object(HumaLabApiClient, "close", autospec=True) as mock_close:
+            client_a = self._client("key_a")
+            client_b = self._client("key_b")
+            self._client("key_a")    # key_a becomes the most recently used
+
+            # In-test
+            self._client("key_c")    # evicts key_b
+
+        # Post-condition
+        mock_close.assert_called_once_with(client_b)
+        self.assertIs(self._client("key_a"), client_a)
+
+    def test_clear_api_clients_should_close_every_client(self):
+        """Test that clearing the cache closes the cached clients and drops them."""
+        # Pre-condition
+        client_a = self._client("key_a")
+        client_b = self._client("key_b")
+
+        with patch.object(HumaLabApiClient, "close", autospec=True) as mock_close:
+            # In-test
+            clear_api_clients()
+
+        # Post-condition
+        self.assertCountEqual([c.args[0] for c in mock_close.call_args_list], [client_a, client_b])
+        self.assertIsNot(self._client("key_a"), client_a)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,7 +7,6 @@ from humalab import humalab
 from humalab.run import Run
 from humalab.scenarios.scenario import Scenario
 from humalab.humalab_config import HumalabConfig
-from humalab.humalab_api_client import HumaLabApiClient
 from humalab.humalab_api_client import EpisodeStatus, RunStatus
 
 
@@ -75,7 +74,7 @@ class HumalabTest(unittest.TestCase):
 
     # Tests for init context manager
 
-    @patch('humalab.humalab.HumaLabApiClient')
+    @patch('humalab.humalab.get_api_client')
     @patch('humalab.humalab.HumalabConfig')
     @patch('humalab.humalab.Scenario')
     @patch('humalab.humalab.Run')
@@ -129,7 +128,7 @@ class HumalabTest(unittest.TestCase):
         # Verify finish was called
         mock_run_inst.finish.assert_called_once()
 
-    @patch('humalab.humalab.HumaLabApiClient')
+    @patch('humalab.humalab.get_api_client')
     @patch('humalab.humalab.HumalabConfig')
     @patch('humalab.humalab.Scenario')
     @patch('humalab.humalab.Run')
@@ -165,7 +164,7 @@ class HumalabTest(unittest.TestCase):
 
         mock_run_inst.finish.assert_called_once()
 
-    @patch('humalab.humalab.HumaLabApiClient')
+    @patch('humalab.humalab.get_api_client')
     @patch('humalab.humalab.HumalabConfig')
     @patch('humalab.humalab.Scenario')
     @patch('humalab.humalab.Run')
@@ -208,7 +207,7 @@ class HumalabTest(unittest.TestCase):
 
         mock_run_inst.finish.assert_called_once()
 
-    @patch('humalab.humalab.HumaLabApiClient')
+    @patch('humalab.humalab.get_api_client')
     @patch('humalab.humalab.HumalabConfig')
     @patch('humalab.humalab.Scenario')
     @patch('humalab.humalab.Run')
@@ -245,7 +244,7 @@ class HumalabTest(unittest.TestCase):
 
         mock_run_inst.finish.assert_called_once()
 
-    @patch('humalab.humalab.HumaLabApiClient')
+    @patch('humalab.humalab.get_api_client')
     @patch('humalab.humalab.HumalabConfig')
     @patch('humalab.humalab.Scenario')
     @patch('humalab.humalab.Run')
@@ -283,7 +282,69 @@ class HumalabTest(unittest.TestCase):
 
         mock_run_inst.finish.assert_called_once()
 
-    @patch('humalab.humalab.HumaLabApiClient')
+    @patch('humalab.humalab.get_api_client')
+    @patch('humalab.humalab.Run')
+    def test_init_should_not_create_project_when_scenario_pull_fails(self, mock_run_class, mock_api_client_class):
+        """Test that init() does not create the project when pulling the scenario fails."""
+        # Pre-condition
+        mock_api_client = Mock()
+        mock_api_client.get_scenario.side_effect = ConnectionError("boom")
+        mock_api_client_class.return_value = mock_api_client
+
+        # In-test
+        with self.assertRaises(ConnectionError):
+            with humalab.init(scenario_id="test-scenario-id"):
+                pass
+
+        # Post-condition
+        mock_api_client.create_project.assert_not_called()
+        mock_api_client.get_run.assert_not_called()
+        mock_run_class.assert_not_called()
+
+    @patch('humalab.humalab.get_api_client')
+    @patch('humalab.humalab._pull_scenario')
+    @patch('humalab.humalab.Run')
+    def test_init_should_not_update_unchanged_existing_run(self, mock_run_class, mock_pull_scenario, mock_api_client_class):
+        """Test that init() treats null fields of an existing running run as unchanged."""
+        # Pre-condition
+        mock_api_client = Mock()
+        mock_api_client.create_project.return_value = {"name": DEFAULT_PROJECT}
+        mock_api_client.get_run.return_value = {"run_id": "run-1", "name": None, "description": None,
+                                                "tags": None, "status": RunStatus.RUNNING.value}
+        mock_api_client_class.return_value = mock_api_client
+
+        # In-test
+        with humalab.init(id="run-1", tags=[]):
+            pass
+
+        # Post-condition
+        mock_api_client.update_run.assert_not_called()
+        mock_api_client.create_run.assert_not_called()
+
+    @patch('humalab.humalab.get_api_client')
+    @patch('humalab.humalab._pull_scenario')
+    @patch('humalab.humalab.Run')
+    def test_init_should_update_changed_existing_run(self, mock_run_class, mock_pull_scenario, mock_api_client_class):
+        """Test that init() writes back an existing run whose fields differ from the request."""
+        # Pre-condition
+        mock_api_client = Mock()
+        mock_api_client.create_project.return_value = {"name": DEFAULT_PROJECT}
+        mock_api_client.get_run.return_value = {"run_id": "run-1", "name": "old", "description": None,
+                                                "tags": ["a"], "status": RunStatus.RUNNING.value}
+        mock_api_client_class.return_value = mock_api_client
+
+        # In-test
+        with humalab.init(id="run-1", name="old", tags=["b"]):
+            pass
+
+        # Post-condition
+        mock_api_client.update_run.assert_called_once_with(run_id="run-1",
+                                                           name="old",
+                                                           description="",
+                                                           tags=["b"],
+                                                           status=RunStatus.RUNNING)
+
+    @patch('humalab.humalab.get_api_client')
     @patch('humalab.humalab.HumalabConfig')
     @patch('humalab.humalab.Scenario')
     @patch('humalab.humalab.Run')
@@ -315,7 +376,7 @@ class HumalabTest(unittest.TestCase):
 
         mock_run_inst.finish.assert_called_once()
 
-    @patch('humalab.humalab.HumaLabApiClient')
+    @patch('humalab.humalab.get_api_client')
     @patch('humalab.humalab.HumalabConfig')
     @patch('humalab.humalab.Scenario')
     @patch('humalab.humalab.Run')
@@ -347,7 +408,7 @@ class HumalabTest(unittest.TestCase):
         # Verify finish was still called
         mock_run_inst.finish.assert_called_once()
 
-    @patch('humalab.humalab.HumaLabApiClient')
+    @patch('humalab.humalab.get_api_client')
     @patch('humalab.humalab.HumalabConfig')
     @patch('humalab.humalab.Scenario')
     @patch('humalab.humalab.Run')
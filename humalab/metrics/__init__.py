@@ -5,6 +5,7 @@ including general metrics, summary statistics, code artifacts, and scenario stat
 """
 
 from .metric import Metrics
+from .batcher import MetricsBatcher
 from .code import Code
 from .scenario_stats import ScenarioStats
 from .summary import Summary
@@ -12,6 +13,7 @@ from .summary import Summary
 __all__ = [
     "Code",
     "Metrics",
+    "MetricsBatcher",
     "ScenarioStats",
     "Summary",
 ]
@@ -0,0 +1,139 @@
+import atexit
+import threading
+import time
+import weakref
+from typing import Any
+
+from humalab.humalab_api_client import HumaLabApiClient
+
+_open_batchers: "weakref.WeakSet[MetricsBatcher]" = weakref.WeakSet()
+"""Batchers not yet closed; flushed at interpreter exit without keeping them alive."""
+
+
+@atexit.register
+def _flush_open_batchers() -> None:
+    """Flush every batcher that is still open at interpreter exit."""
+    for batcher in list(_open_batchers):
+        batcher.flush()
+
+
+class MetricsBatcher:
+    """Buffers metric data points and upserts them to HumaLab in batches.
+
+    Streaming every data point with its own upsert_metrics call costs one HTTP
+    round trip per point. A batcher collects points in memory and sends them in
+    a single upsert once either the point threshold or the time threshold is
+    reached. Remaining points are flushed on close() and, for batchers that are
+    still referenced, at interpreter exit. Points of a failed upsert are kept and
+    sent with the next flush.
+
+    Use as a context manager to flush and detach automatically:
+        with MetricsBatcher(client, "loss", run_id, "line") as batcher:
+            batcher.add({"key": "loss", "values": [0.5], "timestamp": ts})
+
+    Attributes:
+        artifact_key (str): The metric artifact key points are upserted to.
+        pending (int): The number of buffered points not yet sent.
+    """
+    def __init__(self,
+                 api_client: HumaLabApiClient,
+                 artifact_key: str,
+                 run_id: str,
+                 metric_type: str,
+                 episode_id: str | None = None,
+                 max_points: int = 500,
+                 max_interval: float = 2.0) -> None:
+        """Initialize a new MetricsBatcher.
+
+        Args:
+            api_client (HumaLabApiClient): The client used to upsert metrics.
+            artifact_key (str): The metric artifact key.
+            run_id (str): The run the metrics belong to.
+            metric_type (str): The metric display type (e.g., 'line', 'bar').
+            episode_id (str | None): Optional episode ID for episode-level metrics.
+            max_points (int): Number of buffered points that triggers a flush.
+                Defaults to 500.
+            max_interval (float): Seconds since the last flush that trigger a flush
+                on the next add(). Defaults to 2.0.
+        """
+        self._api_client = api_client
+        self._artifact_key = artifact_key
+        self._run_id = run_id
+        self._metric_type = metric_type
+        self._episode_id = episode_id
+        self._max_points = max_points
+        self._max_interval = max_interval
+
+        self._buf: list[dict[str, Any]] = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        _open_batchers.add(self)
+
+    @property
+    def artifact_key(self) -> str:
+        """The metric artifact key points are upserted to.
+
+        Returns:
+            str: The artifact key.
+        """
+        return self._artifact_key
+
+    @property
+    def pending(self) -> int:
+        """The number of buffered points not yet sent.
+
+        Returns:
+            int: The number of pending points.
+        """
+        return len(self._buf)
+
+    def add(self, point: dict[str, Any]) -> None:
+        """Buffer a metric data point, flushing if a threshold is reached.
+
+        Args:
+            point (dict[str, Any]): The data point, with 'key', 'values' and 'timestamp'.
+        """
+        with self._lock:
+            self._buf.append(point)
+            should_flush = (len(self._buf) >= self._max_points
+                            or time.monotonic() - self._last_flush > self._max_interval)
+        if should_flush:
+            self.flush()
+
+    def flush(self) -> None:
+        """Send all buffered points in a single upsert_metrics call.
+
+        If the call raises, the points are put back ahead of any added meanwhile
+        and the exception is re-raised.
+        """
+        with self._lock:
+            snapshot = self._buf
+            self._buf = []
+            self._last_flush = time.monotonic()
+        if not snapshot:
+            return
+        try:
+            self._api_client.upsert_metrics(
+                artifact_key=self._artifact_key,
+                run_id=self._run_id,
+                metric_type=self._metric_type,
+                metric_data=snapshot,
+                episode_id=self._episode_id,
+            )
+        except BaseException:
+            with self._lock:
+                self._buf[:0] = snapshot
+            raise
+
+    def close(self) -> None:
+        """Flush remaining points and stop flushing at interpreter exit."""
+        _open_batchers.discard(self)
+        self.flush()
+
+    def __enter__(self) -> "MetricsBatcher":
+        """Enter the batcher context."""
+        return self
+
+    def __exit__(self, exception_type, exception_value, exception_traceback) -> None:
+        """Exit the batcher context and flush remaining points."""
+        self.close()
@@ -0,0 +1,90 @@
+import gc
+import unittest
+from unittest.mock import MagicMock
+
+from humalab.metrics.batcher import MetricsBatcher, _open_batchers
+
+
+def _point(value: float) -> dict:
+    return {"key": "loss", "values": [value], "timestamp": "2024-01-01T00:00:00Z"}
+
+
+class MetricsBatcherTest(unittest.TestCase):
+    """Unit tests for MetricsBatcher."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.api_client = MagicMock()
+        self.batcher = MetricsBatcher(self.api_client, "loss", "run_id", "line",
+                                      max_points=3, max_interval=3600.0)
+
+    def tearDown(self):
+        """Clean up after each test method."""
+        self.api_client.upsert_metrics.side_effect = None
+        self.batcher.close()
+
+    def test_add_should_flush_when_max_points_reached(self):
+        """Test that reaching the point threshold sends one batched upsert."""
+        # In-test
+        self.batcher.add(_point(1.0))
+        self.batcher.add(_point(2.0))
+        self.api_client.upsert_metrics.assert_not_called()
+        self.batcher.add(_point(3.0))
+
+        # Post-condition
+        self.api_client.upsert_metrics.assert_called_once_with(
+            artifact_key="loss",
+            run_id="run_id",
+            metric_type="line",
+            metric_data=[_point(1.0), _point(2.0), _point(3.0)],
+            episode_id=None,
+        )
+        self.assertEqual(self.batcher.pending, 0)
+
+    def test_close_should_flush_remaining_points(self):
+        """Test that close() sends buffered points and detaches from exit flushing."""
+        # Pre-condition
+        self.batcher.add(_point(1.0))
+
+        # In-test
+        self.batcher.close()
+
+        # Post-condition
+        self.api_client.upsert_metrics.assert_called_once()
+        self.assertEqual(self.api_client.upsert_metrics.call_args.kwargs["metric_data"], [_point(1.0)])
+        self.assertNotIn(self.batcher, _open_batchers)
+
+    def test_flush_should_keep_points_when_upsert_fails(self):
+        """Test that a failed upsert keeps its points ahead of newer ones for the next flush."""
+        # Pre-condition
+        self.batcher.add(_point(1.0))
+        self.api_client.upsert_metrics.side_effect = ConnectionError("boom")
+
+        # In-test
+        with self.assertRaises(ConnectionError):
+            self.batcher.flush()
+        self.api_client.upsert_metrics.side_effect = None
+        self.batcher.add(_point(2.0))
+        self.batcher.flush()
+
+        # Post-condition
+        self.assertEqual(self.api_client.upsert_metrics.call_args.kwargs["metric_data"],
+                         [_point(1.0), _point(2.0)])
+        self.assertEqual(self.batcher.pending, 0)
+
+    def test_unclosed_batcher_should_not_be_kept_alive(self):
+        """Test that the interpreter-exit hook does not hold a reference to the batcher."""
+        # Pre-condition
+        batcher = MetricsBatcher(self.api_client, "other", "run_id", "line")
+        self.assertIn(batcher, _open_batchers)
+
+        # In-test
+        del batcher
+        gc.collect()
+
+        # Post-condition
+        self.assertNotIn("other", [b.artifact_key for b in _open_batchers])
+
+
+if __name__ == "__main__":
+    unittest.main()
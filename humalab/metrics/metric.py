@@ -1,6 +1,8 @@
 from typing import Any
 from humalab.constants import MetricDimType, GraphType
 
+import numpy as np
+
 GRAPH_TO_DIM_TYPE = {
     GraphType.LINE: MetricDimType.ONE_D,
     GraphType.HISTOGRAM: MetricDimType.ONE_D,
@@ -10,6 +12,131 @@ GRAPH_TO_DIM_TYPE = {
     GraphType.THREE_D_MAP: MetricDimType.THREE_D,
 }
 
+_INITIAL_BUFFER_CAPACITY = 64
+"""Number of slots allocated for the first numeric value logged to a buffer."""
+
+
+def _numeric_dtype(value: Any) -> type | None:
+    """Return the NumPy dtype used to pack value, or None if it must stay a Python object.
+
+    Only exact Python floats and ints are packed; NumPy scalars and subclasses keep
+    their own type by staying in a list.
+    """
+    value_type = type(value)
+    if value_type is float:
+        return np.float64
+    if value_type is int:
+        return np.int64
+    return None
+
+
+class _ValueBuffer:
+    """Append-only value storage for logged metric data.
+
+    Runs of Python numbers of one kind (all ints or all floats) are packed into
+    a geometrically grown NumPy array instead of a list of Python objects. The
+    first value that does not fit the array's dtype (mixed kinds, bools, NumPy
+    scalars, sequences, strings, out-of-range ints) converts the buffer to a plain
+    list, so logged values come back from tolist() with their original types.
+    """
+    __slots__ = ("_array", "_list", "_size")
+
+    def __init__(self) -> None:
+        self._array: np.ndarray | None = None
+        self._list: list | None = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, value: Any) -> None:
+        if self._list is not None:
+            self._list.append(value)
+            self._size += 1
+            return
+        array = self._array
+        if array is None:
+            dtype = _numeric_dtype(value)
+            if dtype is None:
+                self._list = [value]
+                self._size = 1
+                return
+            array = self._array = np.empty(_INITIAL_BUFFER_CAPACITY, dtype=dtype)
+        elif _numeric_dtype(value) is not array.dtype.type:
+            if self._size:
+                self._to_list()
+                self.append(value)
+                return
+            # Empty (cleared or reserved) buffer receiving a different kind of
+            # value: keep its capacity but switch dtype
+            dtype = _numeric_dtype(value)
+            if dtype is None:
+                self._array = None
+                self.append(value)
+                return
+            array = self._array = np.empty(len(array), dtype=dtype)
+        elif self._size == len(array):
+            array = self._array = np.resize(array, 2 * len(array))
+        try:
+            array[self._size] = value
+        except OverflowError:
+            self._to_list()
+            self.append(value)
+            return
+        self._size += 1
+
+    def reserve(self, capacity: int) -> None:
+        """Ensure room for capacity packed values without regrowing."""
+        if self._list is not None:
+            return
+        if self._array is None:
+            self._array = np.empty(capacity, dtype=np.float64)
+        elif len(self._array) < capacity:
+            array = np.empty(capacity, dtype=self._array.dtype)
+            array[:self._size] = self._array[:self._size]
+            self._array = array
+
+    def set_last(self, value: Any) -> None:
+        if self._size == 0:
+            raise IndexError("list assignment index out of range")
+        if self._list is not None:
+            self._list[-1] = value
+            return
+        if _numeric_dtype(value) is self._array.dtype.type:
+            try:
+                self._array[self._size - 1] = value
+                return
+            except OverflowError:
+                pass
+        self._to_list()
+        self._list[-1] = value
+
+    def view(self) -> np.ndarray | None:
+        """Return the packed values as an array view, or None if list-backed or empty."""
+        if self._array is None or self._size == 0:
+            return None
+        return self._array[:self._size]
+
+    def tolist(self) -> list:
+        if self._list is not None:
+            return self._list
+        if self._array is None:
+            return []
+        return self._array[:self._size].tolist()
+
+    def clear(self) -> None:
+        """Drop all values, keeping the allocated array for reuse.
+
+        A list handed out by tolist() is released rather than cleared in place,
+        so previously finalized data is never modified.
+        """
+        self._list = None
+        self._size = 0
+
+    def _to_list(self) -> None:
+        self._list = self.tolist()
+        self._array = None
+
 
 class Metrics:
     """Base class for tracking and logging metrics during runs and episodes.
@@ -19,10 +146,13 @@ class Metrics:
     and can be visualized using different graph types.
 
     Subclasses should override _finalize() to implement custom processing logic.
+    Instances use __slots__; subclasses must declare their own __slots__ to keep the memory savings.
 
     Attributes:
         graph_type (GraphType): The type of graph used for visualization.
     """
+    __slots__ = ("_values", "_x_values", "_step", "_metric_dim_type", "_graph_type", "_one_d")
+
     def __init__(self,
                  graph_type: GraphType=GraphType.LINE) -> None:
         """Initialize a new Metrics instance.
@@ -31,11 +161,13 @@ class Metrics:
             graph_type (GraphType): The type of graph to use for visualization
                 (e.g., LINE, BAR, HISTOGRAM, SCATTER). Defaults to LINE.
         """
-        self._values = []
-        self._x_values = []
+        self._values = _ValueBuffer()
+        self._x_values = _ValueBuffer()
         self._step = -1
         self._metric_dim_type = GRAPH_TO_DIM_TYPE.get(graph_type, MetricDimType.ONE_D)
         self._graph_type = graph_type
+        # One-dimensional metrics need no shape checks, so log() can take a fast path
+        self._one_d = self._metric_dim_type is MetricDimType.ONE_D
 
     @property
     def metric_dim_type(self) -> MetricDimType:
@@ -64,17 +196,23 @@ class Metrics:
                 If None, uses an auto-incrementing step counter.
             replace (bool): Whether to replace the last logged value. Defaults to False.
         """
-        if self._graph_type == GraphType.THREE_D_MAP:
+        if self._one_d:
+            if x is None and not replace:
+                self._step += 1
+                self._values.append(data)
+                self._x_values.append(self._step)
+                return
+        elif self._graph_type is GraphType.THREE_D_MAP:
             if len(data) != 3:
                 raise ValueError("Data for 3D map metrics must be a list or tuple of three values.")
-        elif self._graph_type == GraphType.SCATTER:
+        elif self._graph_type is GraphType.SCATTER:
             if len(data) != 2:
                 raise ValueError("Data for scatter metrics must be a list or tuple of two values.")    
         
         if replace:
-            self._values[-1] = data
+            self._values.set_last(data)
             if x is not None:
-                self._x_values[-1] = x
+                self._x_values.set_last(x)
         else:
             self._values.append(data)
             if x is not None:
@@ -82,7 +220,20 @@ class Metrics:
             else:
                 self._x_values.append(self._step + 1)
                 self._step += 1
-        
+
+    def reserve(self, n: int) -> None:
+        """Preallocate storage for n numeric data points.
+
+        Optional; use it when the number of points (e.g., steps in an episode) is
+        known up front, so long runs of log() calls never regrow their buffers.
+        Capacity is kept across finalize() calls.
+
+        Args:
+            n (int): The expected number of data points.
+        """
+        self._values.reserve(n)
+        self._x_values.reserve(n)
+
     def finalize(self) -> dict:
         """Finalize the logged data for processing."""
         ret_result = self._finalize()
@@ -92,10 +243,10 @@ class Metrics:
     def _finalize(self) -> dict:
         """Process the logged data before submission. To be implemented by subclasses."""
         ret_val = {
-            "values": self._values,
-            "x_values": self._x_values
+            "values": self._values.tolist(),
+            "x_values": self._x_values.tolist()
         }
-        self._values = []
-        self._x_values = []
+        self._values.clear()
+        self._x_values.clear()
         self._step = -1
         return ret_val    
@@ -0,0 +1,151 @@
+import unittest
+import numpy as np
+from humalab.constants import GraphType
+from humalab.metrics.metric import Metrics, _ValueBuffer, _INITIAL_BUFFER_CAPACITY
+from humalab.metrics.scenario_stats import ScenarioStats
+from humalab.metrics.summary import Summary
+
+
+class ValueBufferTest(unittest.TestCase):
+    """Unit tests for the _ValueBuffer metric storage."""
+
+    def _fill(self, values: list) -> _ValueBuffer:
+        buffer = _ValueBuffer()
+        for value in values:
+            buffer.append(value)
+        return buffer
+
+    def test_append_should_pack_ints_and_floats(self):
+        """Test that runs of Python ints or floats are packed and round-trip unchanged."""
+        for values, dtype in (([1, 2, 3], np.int64), ([0.1, 0.2, 0.3], np.float64)):
+            with self.subTest(values=values):
+                # In-test
+                buffer = self._fill(values)
+
+                # Post-condition
+                self.assertEqual(buffer.view().dtype, dtype)
+                self.assertEqual(buffer.tolist(), values)
+                self.assertEqual([type(v) for v in buffer.tolist()], [type(v) for v in values])
+
+    def test_append_should_fall_back_to_list_for_mixed_values(self):
+        """Test that mixing ints and floats keeps every value with its original type."""
+        # In-test
+        buffer = self._fill([1, 2.5, 3])
+
+        # Post-condition
+        self.assertIsNone(buffer.view())
+        self.assertEqual(buffer.tolist(), [1, 2.5, 3])
+        self.assertEqual([type(v) for v in buffer.tolist()], [int, float, int])
+
+    def test_append_should_fall_back_to_list_for_unpackable_values(self):
+        """Test that big ints, bools, NumPy scalars and non-numeric values are kept as logged."""
+        cases = (
+            [1, 2 ** 70],
+            [1, True],
+            [0.5, np.float32(0.1)],
+            [0.5, "text"],
+            [(1, 2), (3, 4)],
+        )
+        for values in cases:
+            with self.subTest(values=values):
+                # In-test
+                buffer = self._fill(values)
+
+                # Post-condition
+                self.assertIsNone(buffer.view())
+                self.assertEqual(buffer.tolist(), values)
+                self.assertEqual([type(v) for v in buffer.tolist()], [type(v) for v in values])
+
+    def test_append_should_grow_past_capacity(self):
+        """Test that the packed array grows when more values than its capacity are logged."""
+        # Pre-condition
+        values = [float(i) for i in range(3 * _INITIAL_BUFFER_CAPACITY + 1)]
+
+        # In-test
+        buffer = self._fill(values)
+
+        # Post-condition
+        self.assertEqual(len(buffer), len(values))
+        self.assertEqual(buffer.tolist(), values)
+
+    def test_view_should_return_none_without_values(self):
+        """Test that view() returns None for new, reserved and cleared buffers."""
+        # Pre-condition
+        reserved = _ValueBuffer()
+        reserved.reserve(10)
+        cleared = self._fill([1.0, 2.0])
+        cleared.clear()
+
+        # Post-condition
+        for buffer in (_ValueBuffer(), reserved, cleared):
+            self.assertIsNone(buffer.view())
+            self.assertEqual(buffer.tolist(), [])
+
+
+class MetricsTest(unittest.TestCase):
+    """Unit tests for Metrics and its subclasses."""
+
+    def test_reserve_should_work_for_every_metric_type(self):
+        """Test that reserve() is accepted by every Metrics subclass and keeps logging intact."""
+        metrics = {
+            "metrics": (Metrics(), 1.5, {"values": [1.5], "x_values": [0]}),
+            "scatter": (Metrics(graph_type=GraphType.SCATTER), (1.0, 2.0),
+                        {"values": [(1.0, 2.0)], "x_values": [0]}),
+            "summary": (Summary("max"), 1.5, {"value": 1.5, "summary": "max"}),
+        }
+        for name, (metric, data, expected) in metrics.items():
+            with self.subTest(metric=name):
+                # In-test
+                metric.reserve(10)
+                metric.log(data)
+
+                # Post-condition
+                self.assertEqual(metric.finalize(), expected)
+
+        # Pre-condition
+        stats = ScenarioStats("x", "uniform")
+
+        # In-test
+        stats.reserve(10)
+        stats.log(0.5, x="episode_id")
+
+        # Post-condition
+        self.assertEqual(stats.finalize()["values"], {"episode_id": 0.5})
+
+
+class SummaryTest(unittest.TestCase):
+    """Unit tests for Summary metrics."""
+
+    def test_finalize_should_return_none_when_reserved_but_never_logged(self):
+        """Test that a reserved summary with no logged values finalizes to None."""
+        for summary_type in ("min", "max", "mean", "first", "last"):
+            with self.subTest(summary=summary_type):
+                # Pre-condition
+                summary = Summary(summary_type)
+                summary.reserve(10)
+
+                # In-test
+                result = summary.finalize()
+
+                # Post-condition
+                self.assertEqual(result, {"value": None, "summary": summary_type})
+
+    def test_finalize_should_aggregate_packed_values(self):
+        """Test that numeric values are aggregated per summary type."""
+        expected = {"min": 1.0, "max": 3.0, "mean": 2.0, "first": 2.0, "last": 3.0}
+        for summary_type, value in expected.items():
+            with self.subTest(summary=summary_type):
+                # Pre-condition
+                summary = Summary(summary_type)
+                for data in (2.0, 1.0, 3.0):
+                    summary.log(data)
+
+                # In-test
+                result = summary.finalize()
+
+                # Post-condition
+                self.assertEqual(result, {"value": value, "summary": summary_type})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -57,6 +57,7 @@ class ScenarioStats(Metrics):
         distribution_type (str): The type of distribution (e.g., 'uniform', 'gaussian').
         artifact_type (ArtifactType): The artifact type, always SCENARIO_STATS.
     """
+    __slots__ = ("_name", "_distribution_type", "_needs_flatten", "_artifact_type", "_results")
 
     def __init__(self, 
                  name: str,
@@ -67,6 +68,7 @@ class ScenarioStats(Metrics):
         )
         self._name = name
         self._distribution_type = distribution_type
+        self._needs_flatten = distribution_type in SCENARIO_STATS_NEED_FLATTEN
         self._artifact_type = ArtifactType.SCENARIO_STATS
         self._values = {}
         self._results = {}
@@ -98,6 +100,13 @@ class ScenarioStats(Metrics):
         """
         return self._artifact_type
     
+    def reserve(self, n: int) -> None:
+        """No-op: values are keyed by episode in a dict, which needs no preallocation.
+
+        Args:
+            n (int): The expected number of data points (ignored).
+        """
+
     def log(self, data: Any, x: Any = None, replace: bool = False) -> None:
         """Log a sampled value from the scenario distribution.
 
@@ -110,17 +119,16 @@ class ScenarioStats(Metrics):
         Raises:
             ValueError: If data for the given x already exists and replace is False.
         """
-        if x in self._values:
-            if replace:
-                if self._distribution_type in SCENARIO_STATS_NEED_FLATTEN:
-                    data = data[0]
-                self._values[x] = data
-            else:   
-                raise ValueError(f"Data for episode_id {x} already exists. Use replace=True to overwrite.")
-        else:
-            if self._distribution_type in SCENARIO_STATS_NEED_FLATTEN:
-                data = data[0]
-            self._values[x] = data
+        if self._needs_flatten:
+            data = data[0]
+        values = self._values
+        if replace:
+            values[x] = data
+            return
+        size = len(values)
+        values.setdefault(x, data)
+        if len(values) == size:
+            raise ValueError(f"Data for episode_id {x} already exists. Use replace=True to overwrite.")
     
     def log_status(self,
                    episode_id: str,
@@ -137,13 +145,15 @@ class ScenarioStats(Metrics):
         Raises:
             ValueError: If status for the episode_id already exists and replace is False.
         """
-        if episode_id in self._results:
-            if replace:
-                self._results[episode_id] = episode_status.value
-            else:   
-                raise ValueError(f"Data for episode_id {episode_id} already exists. Use replace=True to overwrite.")
-        else:
-            self._results[episode_id] = episode_status.value
+        results = self._results
+        if replace:
+            results[episode_id] = episode_status.value
+            return
+        # setdefault probes once; an unchanged size means the episode was already logged
+        size = len(results)
+        results.setdefault(episode_id, episode_status.value)
+        if len(results) == size:
+            raise ValueError(f"Data for episode_id {episode_id} already exists. Use replace=True to overwrite.")
 
     def _finalize(self) -> dict:
         """Finalize and return all collected scenario statistics.
@@ -2,6 +2,24 @@
 from humalab.metrics.metric import Metrics
 from humalab.constants import MetricDimType, GraphType
 
+import numpy as np
+
+_ARRAY_SUMMARY = {
+    "min": np.min,
+    "max": np.max,
+    "mean": np.mean,
+    "first": lambda array: array[0],
+    "last": lambda array: array[-1],
+}
+
+_LIST_SUMMARY = {
+    "min": min,
+    "max": max,
+    "mean": lambda values: sum(values) / len(values),
+    "first": lambda values: values[0],
+    "last": lambda values: values[-1],
+}
+
 
 class Summary(Metrics):
     """A metric that aggregates logged values into a single summary statistic.
@@ -13,6 +31,8 @@ class Summary(Metrics):
     Attributes:
         summary (str): The aggregation method used.
     """
+    __slots__ = ("_summary",)
+
     def __init__(self,
                  summary: str,
                  ) -> None:
@@ -44,30 +64,25 @@ class Summary(Metrics):
         Returns:
             dict: Dictionary containing the aggregated value and summary type.
         """
-        if not self._values:
+        if self.summary == "none":
+            return {
+                "value": None,
+                "summary": self.summary
+            }
+        array = self._values.view()
+        if array is not None:
+            # Numeric values are packed, so reduce them with NumPy in C
+            return {
+                "value": _ARRAY_SUMMARY[self.summary](array).item(),
+                "summary": self.summary
+            }
+        values = self._values.tolist()
+        if not values:
             return {
                 "value": None,
                 "summary": self.summary
             }
-        final_val = None
-        # For summary metrics, we only keep the latest value
-        if self.summary == "last":
-            final_val = self._values[-1]
-        elif self.summary == "first":
-            final_val = self._values[0]
-        elif self.summary == "none":
-            final_val = None
-        elif self.summary in {"min", "max", "mean"}:
-            if not self._values:
-                final_val = None
-            else:
-                if self.summary == "min":
-                    agg_value = min(self._values)
-                elif self.summary == "max":
-                    agg_value = max(self._values)
-                elif self.summary == "mean":
-                    agg_value = sum(self._values) / len(self._values)
-                final_val = agg_value
+        final_val = _LIST_SUMMARY[self.summary](values)
 
         return {
             "value": final_val,
@@ -1,20 +1,24 @@
+from concurrent.futures import Future, ThreadPoolExecutor
 import uuid
 import traceback
-import pickle
 import base64
 
 from humalab.metrics.code import Code
 from humalab.metrics.summary import Summary
 
-from humalab.constants import DEFAULT_PROJECT, RESERVED_NAMES, ArtifactType
+from humalab.constants import DEFAULT_PROJECT, MAX_UPLOAD_WORKERS, RESERVED_NAMES, ArtifactType
 from humalab.metrics.scenario_stats import ScenarioStats
-from humalab.humalab_api_client import EpisodeStatus, HumaLabApiClient, RunStatus
+from humalab.humalab_api_client import EpisodeStatus, RunStatus, get_api_client
 from humalab.metrics.metric import Metrics
 from humalab.episode import Episode
-from humalab.utils import is_standard_type
+from humalab.utils import is_standard_type, pickle_artifact
 
 from humalab.scenarios.scenario import Scenario
 
+_STATUS_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="humalab-run-status")
+"""Sends final run status updates for finish(wait=False). Its worker threads are
+joined at interpreter exit, so queued updates are still delivered."""
+
 class Run:
     """Represents a run containing multiple episodes for a scenario.
 
@@ -35,6 +39,10 @@ class Run:
         tags (list[str]): A list of tags associated with the run.
         scenario (Scenario): The scenario associated with the run.
     """
+    __slots__ = ("_project", "_id", "_name", "_description", "_tags", "_scenario",
+                 "_logs", "_metric_logs", "_episodes", "_is_finished", "_api_client",
+                 "_status_future")
+
     def __init__(self,
                  scenario: Scenario,
                  project: str = DEFAULT_PROJECT,
@@ -66,12 +74,15 @@ class Run:
 
         self._scenario = scenario
         self._logs = {}
+        # Metrics held in _logs, indexed separately so log() can dispatch without type checks
+        self._metric_logs: dict[str, Metrics] = {}
         self._episodes = {}
         self._is_finished = False
+        self._status_future: Future | None = None
 
-        self._api_client = HumaLabApiClient(base_url=base_url,
-                                            api_key=api_key,
-                                            timeout=timeout)
+        self._api_client = get_api_client(base_url=base_url,
+                                          api_key=api_key,
+                                          timeout=timeout)
 
     
     @property
@@ -169,6 +180,7 @@ class Run:
                 stat = ScenarioStats(name=metric_name,
                                     distribution_type=value["distribution"])
                 self._logs[metric_name] = stat
+                self._metric_logs[metric_name] = stat
             self._logs[metric_name].log(data=value["value"],
                                         x=episode.episode_id)
         self._episodes[episode.episode_id] = episode
@@ -186,6 +198,7 @@ class Run:
         if name in self._logs:
             raise ValueError(f"{name} is a reserved name and is not allowed.")
         self._logs[name] = metric
+        self._metric_logs[name] = metric
 
     def log_code(self, key: str, code_content: str) -> None:
         """Log code content as an artifact.
@@ -196,6 +209,7 @@ class Run:
         """
         if key in RESERVED_NAMES:
             raise ValueError(f"{key} is a reserved name and is not allowed.")
+        self._metric_logs.pop(key, None)
         self._logs[key] = Code(
             run_id=self._id,
             key=key,
@@ -214,21 +228,23 @@ class Run:
         Raises:
             ValueError: If a key is reserved or logging fails.
         """
+        metric_logs = self._metric_logs
+        get_metric = metric_logs.get
+        # x is loop-invariant, so resolve the per-key x lookup once
+        get_x = (x or {}).get
         for key, value in data.items():
             if key in RESERVED_NAMES:
                 raise ValueError(f"{key} is a reserved name and is not allowed.")
-            if key not in self._logs:
+            metric = get_metric(key)
+            if metric is not None:
+                metric.log(value, x=get_x(key), replace=replace)
+            elif key not in self._logs or replace:
                 self._logs[key] = value
+                if isinstance(value, Metrics):
+                    metric_logs[key] = value
             else:
-                cur_val = self._logs[key]
-                if isinstance(cur_val, Metrics):
-                    cur_x = x.get(key) if x is not None else None
-                    cur_val.log(value, x=cur_x, replace=replace)
-                else:
-                    if replace:
-                        self._logs[key] = value
-                    else:
-                        raise ValueError(f"Cannot log value for key '{key}' as there is already a value logged.")
+                raise ValueError(f"Cannot log value for key '{key}' as there is already a value logged.")
+
     def _finish_episodes(self,
                          status: RunStatus,
                          err_msg: str | None = None) -> None:
@@ -244,82 +260,121 @@ class Run:
 
     def finish(self,
                status: RunStatus = RunStatus.FINISHED,
-               err_msg: str | None = None) -> None:
+               err_msg: str | None = None,
+               wait: bool = True) -> None:
         """Finish the run and submit final metrics.
 
         Args:
             status (RunStatus): The final status of the run.
             err_msg (str | None): An optional error message.
+            wait (bool): Whether to block until the final run status is sent. If False,
+                the status update is sent in the background after all artifacts are
+                uploaded; use wait_finished() to wait for it and surface its errors.
+                Defaults to True.
         """
         if self._is_finished:
             return
         self._is_finished = True
         self._finish_episodes(status=status, err_msg=err_msg)
 
-        self._api_client.upload_code(
-            artifact_key="scenario",
-            run_id=self._id,
-            code_content=self.scenario.yaml
-        )
+        # Artifact uploads are independent, so overlap their round trips.
+        with ThreadPoolExecutor(max_workers=MAX_UPLOAD_WORKERS) as executor:
+            futures = [executor.submit(
+                self._api_client.upload_code,
+                artifact_key="scenario",
+                run_id=self._id,
+                code_content=self.scenario.yaml
+            ), executor.submit(
+                self._api_client.upload_python,
+                artifact_key="seed",
+                run_id=self._id,
+                pickled_bytes=pickle_artifact(self.scenario.seed)
+            )]
+            # TODO: submit final metrics
+            for key, value in self._logs.items():
+                if isinstance(value, ScenarioStats):
+                    for episode_id, episode in self._episodes.items():
+                        episode_status = episode.status
+                        value.log_status(
+                            episode_id=episode_id,
+                            episode_status=episode_status
+                        )
+                    metric_val = value.finalize()
+                    pickled = pickle_artifact(metric_val)
+                    futures.append(executor.submit(
+                        self._api_client.upload_scenario_stats_artifact,
+                        artifact_key=key,
+                        run_id=self._id,
+                        pickled_bytes=pickled,
+                        graph_type=value.graph_type.value,
+                    ))
+                elif isinstance(value, Summary):
+                    metric_val = value.finalize()
+                    pickled = pickle_artifact(metric_val["value"])
+                    futures.append(executor.submit(
+                        self._api_client.upload_python,
+                        artifact_key=key,
+                        run_id=self._id,
+                        pickled_bytes=pickled
+                    ))
+                elif isinstance(value, Metrics):
+                    metric_val = value.finalize()
+                    pickled = pickle_artifact(metric_val)
+                    futures.append(executor.submit(
+                        self._api_client.upload_metrics,
+                        artifact_key=key,
+                        run_id=self._id,
+                        pickled_bytes=pickled,
+                        graph_type=value.graph_type.value,
+                    ))
+                elif isinstance(value, Code):
+                    futures.append(executor.submit(
+                        self._api_client.upload_code,
+                        artifact_key=value.key,
+                        run_id=value.run_id,
+                        episode_id=value.episode_id,
+                        code_content=value.code_content
+                    ))
+                else:
+                    if not is_standard_type(value):
+                        raise ValueError(f"Value for key '{key}' is not a standard type.")
+                    pickled = pickle_artifact(value)
+                    futures.append(executor.submit(
+                        self._api_client.upload_python,
+                        artifact_key=key,
+                        run_id=self._id,
+                        pickled_bytes=pickled
+                    ))
+
+            for future in futures:
+                future.result()
+
+        if wait:
+            self._api_client.update_run(
+                run_id=self._id,
+                status=status,
+                err_msg=err_msg
+            )
+        else:
+            self._status_future = _STATUS_EXECUTOR.submit(
+                self._api_client.update_run,
+                run_id=self._id,
+                status=status,
+                err_msg=err_msg
+            )
 
-        self._api_client.upload_python(
-            artifact_key="seed",
-            run_id=self._id,
-            pickled_bytes=pickle.dumps(self.scenario.seed)
-        )
-        # TODO: submit final metrics
-        for key, value in self._logs.items():
-            if isinstance(value, ScenarioStats):
-                for episode_id, episode in self._episodes.items():
-                    episode_status = episode.status
-                    value.log_status(
-                        episode_id=episode_id,
-                        episode_status=episode_status
-                    )
-                metric_val = value.finalize()
-                pickled = pickle.dumps(metric_val)
-                self._api_client.upload_scenario_stats_artifact(
-                    artifact_key=key,
-                    run_id=self._id,
-                    pickled_bytes=pickled,
-                    graph_type=value.graph_type.value,
-                )
-            elif isinstance(value, Summary):
-                metric_val = value.finalize()
-                pickled = pickle.dumps(metric_val["value"])
-                self._api_client.upload_python(
-                    artifact_key=key,
-                    run_id=self._id,
-                    pickled_bytes=pickled
-                )
-            elif isinstance(value, Metrics):
-                metric_val = value.finalize()
-                pickled = pickle.dumps(metric_val)
-                self._api_client.upload_metrics(
-                    artifact_key=key,
-                    run_id=self._id,
-                    pickled_bytes=pickled,
-                    graph_type=value.graph_type.value,
-                )
-            elif isinstance(value, Code):
-                self._api_client.upload_code(
-                    artifact_key=value.key,
-                    run_id=value.run_id,
-                    episode_id=value.episode_id,
-                    code_content=value.code_content
-                )
-            else:
-                if not is_standard_type(value):
-                    raise ValueError(f"Value for key '{key}' is not a standard type.")
-                pickled = pickle.dumps(value)
-                self._api_client.upload_python(
-                    artifact_key=key,
-                    run_id=self._id,
-                    pickled_bytes=pickled
-                )
-
-        self._api_client.update_run(
-            run_id=self._id,
-            status=status,
-            err_msg=err_msg
-        )
\ No newline at end of file
+    def wait_finished(self, timeout: float | None = None) -> None:
+        """Wait for a status update sent by finish(wait=False).
+
+        Returns immediately if the run was finished synchronously or not at all.
+
+        Args:
+            timeout (float | None): Maximum number of seconds to wait. None waits
+                indefinitely.
+
+        Raises:
+            TimeoutError: If the update did not complete within timeout.
+            requests.HTTPError: If the status update failed.
+        """
+        if self._status_future is not None:
+            self._status_future.result(timeout=timeout)
\ No newline at end of file
@@ -0,0 +1,96 @@
+import threading
+import unittest
+from unittest.mock import patch, MagicMock
+
+from humalab.humalab_api_client import RunStatus
+from humalab.metrics.metric import Metrics
+from humalab.metrics.summary import Summary
+from humalab.run import Run
+from humalab.scenarios.scenario import Scenario
+
+
+class RunTest(unittest.TestCase):
+    """Unit tests for Run."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.api_client = MagicMock()
+        scenario = Scenario()
+        scenario.init(scenario={"a": 1}, seed=42)
+        with patch("humalab.run.get_api_client", return_value=self.api_client):
+            self.run = Run(scenario=scenario, project="test_project", id="run_id")
+        self.run.add_metric("loss", Metrics())
+        self.run.add_metric("best", Summary("max"))
+        self.run.log({"loss": 0.5, "best": 2.0, "note": "text"})
+
+    def test_finish_should_upload_every_artifact(self):
+        """Test that finish() submits all artifacts before sending the final status."""
+        # In-test
+        self.run.finish()
+
+        # Post-condition
+        upload_python_keys = {c.kwargs["artifact_key"] for c in self.api_client.upload_python.call_args_list}
+        self.assertEqual(upload_python_keys, {"seed", "best", "note"})
+        self.api_client.upload_code.assert_called_once()
+        self.assertEqual(self.api_client.upload_code.call_args.kwargs["artifact_key"], "scenario")
+        self.api_client.upload_metrics.assert_called_once()
+        self.assertEqual(self.api_client.upload_metrics.call_args.kwargs["artifact_key"], "loss")
+        self.api_client.update_run.assert_called_once_with(run_id="run_id",
+                                                           status=RunStatus.FINISHED,
+                                                           err_msg=None)
+
+    def test_finish_should_raise_upload_errors(self):
+        """Test that an exception raised by an upload worker reaches the caller."""
+        # Pre-condition
+        self.api_client.upload_metrics.side_effect = ConnectionError("boom")
+
+        # In-test
+        with self.assertRaises(ConnectionError):
+            self.run.finish()
+
+        # Post-condition
+        self.api_client.upload_code.assert_called_once()
+        self.api_client.update_run.assert_not_called()
+
+    def test_finish_without_wait_should_return_before_status_update(self):
+        """Test that finish(wait=False) returns while update_run is still running."""
+        # Pre-condition
+        release = threading.Event()
+        self.api_client.update_run.side_effect = lambda **kwargs: release.wait(5)
+
+        # In-test
+        self.run.finish(wait=False)
+        returned_while_pending = not release.is_set()
+        release.set()
+        self.run.wait_finished(timeout=5)
+
+        # Post-condition
+        self.assertTrue(returned_while_pending)
+        self.api_client.update_run.assert_called_once_with(run_id="run_id",
+                                                           status=RunStatus.FINISHED,
+                                                           err_msg=None)
+
+    def test_wait_finished_should_raise_status_update_error(self):
+        """Test that wait_finished() re-raises an exception from the background update_run."""
+        # Pre-condition
+        self.api_client.update_run.side_effect = ConnectionError("boom")
+        self.run.finish(wait=False)
+
+        # In-test / Post-condition
+        with self.assertRaises(ConnectionError):
+            self.run.wait_finished(timeout=5)
+
+    def test_wait_finished_should_do_nothing_after_synchronous_finish(self):
+        """Test that wait_finished() returns immediately after finish(wait=True)."""
+        # Pre-condition
+        self.run.finish(wait=True)
+
+        # In-test
+        self.run.wait_finished(timeout=0)
+
+        # Post-condition
+        self.api_client.update_run.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
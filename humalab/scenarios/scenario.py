@@ -1,9 +1,9 @@
+from contextvars import ContextVar
 from typing import Any
-from threading import RLock
+from threading import Lock
 
 import numpy as np
-from omegaconf import OmegaConf, DictConfig, ListConfig
-import yaml
+from omegaconf import OmegaConf, DictConfig, ListConfig, Node
 from humalab.dists.bernoulli import Bernoulli
 from humalab.dists.categorical import Categorical
 from humalab.dists.uniform import Uniform
@@ -11,157 +11,76 @@ from humalab.dists.discrete import Discrete
 from humalab.dists.log_uniform import LogUniform
 from humalab.dists.gaussian import Gaussian
 from humalab.dists.truncated_gaussian import TruncatedGaussian
-from functools import partial
+from functools import lru_cache, partial
 from humalab.constants import GraphType, MetricDimType
 import copy
 import uuid
-
-DISTRIBUTION_MAP = {
-    # 0D distributions
-    "uniform": Uniform,
-    "bernoulli": Bernoulli,
-    "categorical": Categorical,
-    "discrete": Discrete,
-    "log_uniform": LogUniform,
-    "gaussian": Gaussian,
-    "truncated_gaussian": TruncatedGaussian,
-
-    # 1D distributions
-    "uniform_1d": Uniform,
-    "bernoulli_1d": Bernoulli,
-    "categorical_1d": Categorical,
-    "discrete_1d": Discrete,
-    "log_uniform_1d": LogUniform,
-    "gaussian_1d": Gaussian,
-    "truncated_gaussian_1d": TruncatedGaussian,
-
-    # 2D distributions
-    "uniform_2d": Uniform,
-    # "bernoulli_2d": Bernoulli,
-    # "categorical_2d": Categorical,
-    # "discrete_2d": Discrete,
-    # "log_uniform_2d": LogUniform,
-    "gaussian_2d": Gaussian,
-    "truncated_gaussian_2d": TruncatedGaussian,
-
-    # 3D distributions
-    "uniform_3d": Uniform,
-    # "bernoulli_3d": Bernoulli,
-    # "categorical_3d": Categorical,
-    # "discrete_3d": Discrete,
-    # "log_uniform_3d": LogUniform,
-    "gaussian_3d": Gaussian,
-    "truncated_gaussian_3d": TruncatedGaussian,
-
-    # 4D distributions
-    # "uniform_4d": Uniform,
-    # "bernoulli_4d": Bernoulli,
-    # "categorical_4d": Categorical,
-    # "discrete_4d": Discrete,
-    # "log_uniform_4d": LogUniform,
-    # "gaussian_4d": Gaussian,
-    # "truncated_gaussian_4d": TruncatedGaussian,
-    
-    # nD distributions
-    # "uniform_nd": Uniform,
-    # "bernoulli_nd": Bernoulli,
-    # "categorical_nd": Categorical,
-    # "discrete_nd": Discrete,
-    # "log_uniform_nd": LogUniform,
-    # "gaussian_nd": Gaussian,
-    # "truncated_gaussian_nd": TruncatedGaussian,
-    
+import warnings
+
+_BASE_DISTRIBUTIONS = {
+    # name: (class, number of parameters, supported dimensions)
+    "uniform": (Uniform, 2, (0, 1, 2, 3)),
+    "bernoulli": (Bernoulli, 1, (0, 1)),
+    "categorical": (Categorical, 2, (0, 1)),
+    "discrete": (Discrete, 3, (0, 1)),
+    "log_uniform": (LogUniform, 2, (0, 1)),
+    "gaussian": (Gaussian, 2, (0, 1, 2, 3)),
+    "truncated_gaussian": (TruncatedGaussian, 4, (0, 1, 2, 3)),
 }
-
-DISTRIBUTION_DIMENSION_MAP = {
-    # 0D distributions
-    "uniform": 0,
-    "bernoulli": 0,
-    "categorical": 0,
-    "discrete": 0,
-    "log_uniform": 0,
-    "gaussian": 0,
-    "truncated_gaussian": 0,
-
-    # 1D distributions
-    "uniform_1d": 1,
-    "bernoulli_1d": 1,
-    "categorical_1d": 1,
-    "discrete_1d": 1,
-    "log_uniform_1d": 1,
-    "gaussian_1d": 1,
-    "truncated_gaussian_1d": 1,
-
-    # 2D distributions
-    "uniform_2d": 2,
-    "gaussian_2d": 2,
-    "truncated_gaussian_2d": 2,
-
-    # 3D distributions
-    "uniform_3d": 3,
-    "gaussian_3d": 3,
-    "truncated_gaussian_3d": 3,
+"""Supported distributions. Each is exposed as a resolver for its 0D form ('uniform')
+and every supported dimension ('uniform_1d', 'uniform_2d', ...)."""
+
+_DIM_TYPES = {
+    0: MetricDimType.ONE_D,
+    1: MetricDimType.ONE_D,
+    2: MetricDimType.TWO_D,
+    3: MetricDimType.THREE_D,
 }
 
-DISTRIBUTION_PARAM_NUM_MAP = {
-    # 0D distributions
-    "uniform": 2,
-    "bernoulli": 1,
-    "categorical": 2,
-    "discrete": 3,
-    "log_uniform": 2,
-    "gaussian": 2,
-    "truncated_gaussian": 4,
-
-    # 1D distributions
-    "uniform_1d": 2,
-    "bernoulli_1d": 1,
-    "categorical_1d": 2,
-    "discrete_1d": 3,
-    "log_uniform_1d": 2,
-    "gaussian_1d": 2,
-    "truncated_gaussian_1d": 4,
-
-    # 2D distributions
-    "uniform_2d": 2,
-    "gaussian_2d": 2,
-    "truncated_gaussian_2d": 4,
-
-    # 3D distributions
-    "uniform_3d": 2,
-    "gaussian_3d": 2,
-    "truncated_gaussian_3d": 4,
+_DIST_INFO = {
+    (name if dim == 0 else f"{name}_{dim}d"): (dist_cls, dim, num_params)
+    for dim in _DIM_TYPES
+    for name, (dist_cls, num_params, dims) in _BASE_DISTRIBUTIONS.items()
+    if dim in dims
 }
+"""Distribution class, dimensions and parameter count per resolver name, looked up once per sample."""
+
+DISTRIBUTION_MAP = {name: info[0] for name, info in _DIST_INFO.items()}
+DISTRIBUTION_DIMENSION_MAP = {name: info[1] for name, info in _DIST_INFO.items()}
+DISTRIBUTION_PARAM_NUM_MAP = {name: info[2] for name, info in _DIST_INFO.items()}
+SCENARIO_STATS_DIM_TYPE_MAP = {name: _DIM_TYPES[info[1]] for name, info in _DIST_INFO.items()}
+
+_ACTIVE_SCENARIO: ContextVar[tuple["Scenario", dict, list | None]] = ContextVar("humalab_active_scenario")
+"""The Scenario whose distributions the registered resolvers sample from, the
+episode values dict they record samples into, and the resolve plan being recorded
+(None when not recording)."""
+
+
+def _distribution_resolver(dist_name: str, *args, _node_: Node, **kwargs) -> Any:
+    """OmegaConf resolver for every distribution name, dispatching to the active Scenario."""
+    scenario, episode_vals, plan = _ACTIVE_SCENARIO.get()
+    return scenario._sample_node(dist_name, args, _node_, kwargs, episode_vals, plan)
+
+
+@lru_cache(maxsize=128)
+def _warn_extra_params(dist_name: str, expected: int, got: int) -> None:
+    """Warn once per distribution and argument count that extra parameters are ignored."""
+    warnings.warn(
+        f"Too many parameters for {dist_name}, expected {expected}, got {got}. Extra parameters will be ignored.",
+        stacklevel=2,
+    )
+
+
+def _register_resolvers() -> None:
+    """Register the distribution resolvers unless they are already registered.
+
+    Resolvers are global to OmegaConf and independent of any Scenario instance, so
+    they are registered once per process, however many scenarios are initialized.
+    """
+    for dist_name in DISTRIBUTION_MAP:
+        if not OmegaConf.has_resolver(dist_name):
+            OmegaConf.register_new_resolver(dist_name, partial(_distribution_resolver, dist_name))
 
-SCENARIO_STATS_DIM_TYPE_MAP = {
-    # 0D distributions
-    "uniform": MetricDimType.ONE_D,
-    "bernoulli": MetricDimType.ONE_D,
-    "categorical": MetricDimType.ONE_D,
-    "discrete": MetricDimType.ONE_D,
-    "log_uniform": MetricDimType.ONE_D,
-    "gaussian": MetricDimType.ONE_D,
-    "truncated_gaussian": MetricDimType.ONE_D,
-
-    # 1D distributions
-    "uniform_1d": MetricDimType.ONE_D,
-    "bernoulli_1d": MetricDimType.ONE_D,
-    "categorical_1d": MetricDimType.ONE_D,
-    "discrete_1d": MetricDimType.ONE_D,
-    "log_uniform_1d": MetricDimType.ONE_D,
-    "gaussian_1d": MetricDimType.ONE_D,
-    "truncated_gaussian_1d": MetricDimType.ONE_D,
-
-    # 2D distributions
-    "uniform_2d": MetricDimType.TWO_D,
-    "gaussian_2d": MetricDimType.TWO_D,
-    "truncated_gaussian_2d": MetricDimType.TWO_D,
-
-    # 3D distributions
-    "uniform_3d": MetricDimType.THREE_D,
-    "gaussian_3d": MetricDimType.THREE_D,
-    "truncated_gaussian_3d": MetricDimType.THREE_D,
-}
 
 class Scenario:
     """Manages scenario configurations with probabilistic distributions.
@@ -178,7 +97,6 @@ class Scenario:
         template (DictConfig | ListConfig): The template scenario configuration.
         yaml (str): The current scenario configuration as a YAML string.
     """
-    dist_cache = {}
     def __init__(self) -> None:
         self._generator = np.random.default_rng()
         self._scenario_template = OmegaConf.create()
@@ -187,7 +105,12 @@ class Scenario:
         self._seed = None
 
         self._episode_vals = {}
-        self._lock = RLock()
+        # Distributions keyed by their resolver expression; the lock also guards the
+        # generator they draw from
+        self.dist_cache = {}
+        self._sample_lock = Lock()
+        # Distribution nodes recorded by the first resolve() of the template (see resolve)
+        self._resolve_plan = None
 
     def init(self,
              scenario: str | list | dict | None = None,
@@ -212,11 +135,8 @@ class Scenario:
         # Parse scenario id
         scenario_version = 1
         if scenario_id is not None:
-            scenario_arr = scenario_id.split(":")
-            if len(scenario_arr) < 1:
-                raise ValueError("Invalid scenario_id format. Expected 'scenario_id' or 'scenario_name:version'.")
-            scenario_id = scenario_arr[0]
-            scenario_version = int(scenario_arr[1]) if len(scenario_arr) > 1 else None
+            scenario_id, sep, version_str = scenario_id.partition(":")
+            scenario_version = int(version_str) if sep else None
         self._scenario_id = scenario_id or str(uuid.uuid4())
         self._scenario_version = scenario_version
 
@@ -227,8 +147,8 @@ class Scenario:
         self._scenario_template = OmegaConf.create(scenario)
     
     def _validate_distribution_params(self, dist_name: str, *args: tuple) -> None:
-        dimensions = DISTRIBUTION_DIMENSION_MAP[dist_name]
-        if not DISTRIBUTION_MAP[dist_name].validate(dimensions, *args):
+        dist_cls, dimensions, _ = _DIST_INFO[dist_name]
+        if not dist_cls.validate(dimensions, *args):
             raise ValueError(f"Invalid parameters for distribution {dist_name} with dimensions {dimensions}: {args}")
 
     def _get_final_size(self, size: int | tuple[int, ...] | None) -> int | tuple[int, ...] | None:
@@ -241,102 +161,172 @@ class Scenario:
             return (n, size)
         return (n, *size)
     
-    def _get_node_path(self, root: dict | list, node: str) -> str:
-        if isinstance(root, list):
-            root = {str(i): v for i, v in enumerate(root)}
-        
-        for key, value in root.items():
-            if value == node:
-                return str(key)
-            if isinstance(value, dict):
-                sub_path = self._get_node_path(value, node)
-                if sub_path:
-                    return f"{key}.{sub_path}"
-            elif isinstance(value, list):
-                for idx, item in enumerate(value):
-                    if item == node:
-                        return f"{key}[{idx}]"
-                    if isinstance(item, (dict, list)):
-                        sub_path = self._get_node_path(item, node)
-                        if sub_path:
-                            return f"{key}[{idx}].{sub_path}"
-        return ""
+    @staticmethod
+    def _node_steps(node: Node) -> list[tuple[Any, bool]]:
+        """The keys leading from the root config to a node, each with whether its parent is a list."""
+        steps = []
+        parent = node._get_parent()
+        while parent is not None:
+            steps.append((node._key(), isinstance(parent, ListConfig)))
+            node, parent = parent, parent._get_parent()
+        steps.reverse()
+        return steps
 
     @staticmethod
-    def _convert_to_python(obj) -> Any:
-        if not isinstance(obj, (np.ndarray, np.generic)):
-            return obj
+    def _node_key_path(node: Node) -> str:
+        """Build the path of a config node from its parent chain.
 
-        # NumPy scalar (np.generic) or 0-D ndarray
-        if isinstance(obj, np.generic) or (isinstance(obj, np.ndarray) and obj.ndim == 0):
-            return obj.item()
+        Keys are joined with '.', and the path form restarts at every container found
+        inside a list: a list that is a value (of a mapping key, or of an index of such
+        a restarted list) has its indices written as '[i]', while the root list and
+        lists directly inside a bracketed list use plain '.i' segments.
+        """
+        path = ""
+        bracketed = False   # whether the current parent list writes '[i]'
+        for key, in_list in Scenario._node_steps(node):
+            if in_list and bracketed:
+                path = f"{path}[{key}]"
+            else:
+                path = f"{path}.{key}" if path else str(key)
+            bracketed = not (in_list and bracketed)
+        return path
 
-        # Regular ndarray (1-D or higher)
-        if isinstance(obj, np.ndarray):
+    @staticmethod
+    def _convert_to_python(obj) -> Any:
+        if isinstance(obj, (np.ndarray, np.generic)):
+            # tolist() returns a Python scalar for NumPy scalars and 0-D arrays,
+            # and nested lists for 1-D or higher arrays
             return obj.tolist()
-
         return obj
 
     def _configure(self) -> None:
-        self._clear_resolvers()
-        def distribution_resolver(dist_name: str, *args, _node_, _root_, _parent_, **kwargs):
-            if len(args) > DISTRIBUTION_PARAM_NUM_MAP[dist_name]:
-                args = args[:DISTRIBUTION_PARAM_NUM_MAP[dist_name]]
-                print(f"Warning: Too many parameters for {dist_name}, expected {DISTRIBUTION_PARAM_NUM_MAP[dist_name]}, got {len(args)}. Extra parameters will be ignored.")
-            
-            self._validate_distribution_params(dist_name, *args)
-            # print("_node_: ", _node_, type(_node_))
-            # print("_root_: ", _root_, type(_root_))
-            # print("_parent_: ", _parent_, type(_parent_))
-            # print("Args: ", args, len(args))
-            # print("Kwargs: ", kwargs)
-
-            root_yaml = yaml.safe_load(OmegaConf.to_yaml(_root_))
-            key_path = self._get_node_path(root_yaml, str(_node_))
-            
-            shape = None 
-            
-            if DISTRIBUTION_DIMENSION_MAP[dist_name] == -1:
-                shape = args[DISTRIBUTION_PARAM_NUM_MAP[dist_name] - 1]
-                args = args[:-1]
-            else:
-                shape = DISTRIBUTION_DIMENSION_MAP[dist_name] if DISTRIBUTION_DIMENSION_MAP[dist_name] > 0 else None
-            shape = self._get_final_size(shape)
-
-            key = str(_node_)
-            if key not in Scenario.dist_cache:
-                Scenario.dist_cache[key] = DISTRIBUTION_MAP[dist_name].create(self._generator, *args, size=shape, **kwargs)
-            ret_val = Scenario.dist_cache[key].sample()
-            ret_val = Scenario._convert_to_python(ret_val)
-
-            if isinstance(ret_val, list):
-                ret_val = ListConfig(ret_val)
-            
-            self._episode_vals[key_path] = {
-                    "value": ret_val,
-                    "distribution": dist_name,
-                }
-            return ret_val
+        self.dist_cache.clear()
+        self._resolve_plan = None
+        _register_resolvers()
+        # Lazy interpolation outside resolve() samples through the latest initialized scenario
+        _ACTIVE_SCENARIO.set((self, self._episode_vals, None))
+
+    def _sample_node(self,
+                     dist_name: str,
+                     args: tuple,
+                     node: Node,
+                     kwargs: dict,
+                     episode_vals: dict,
+                     plan: list | None = None) -> Any:
+        """Sample the distribution behind a resolver node and record it in the episode values.
+
+        When a resolve plan is being recorded, the node is appended to it, or None is
+        appended if its value is more than a single distribution call.
+        """
+        dist_cls, dimensions, num_params = _DIST_INFO[dist_name]
+        if len(args) > num_params:
+            _warn_extra_params(dist_name, num_params, len(args))
+            args = args[:num_params]
 
-        for dist_name in DISTRIBUTION_MAP.keys():
-            OmegaConf.register_new_resolver(dist_name, partial(distribution_resolver, dist_name))
+        self._validate_distribution_params(dist_name, *args)
+
+        key_path = Scenario._node_key_path(node)
+
+        shape = None
+
+        if dimensions == -1:
+            shape = args[num_params - 1]
+            args = args[:-1]
+        else:
+            shape = dimensions if dimensions > 0 else None
+        shape = self._get_final_size(shape)
+
+        key = str(node)
+        if plan is not None:
+            if key.startswith("${") and key.endswith("}") and key.count("${") == 1:
+                steps = tuple(k for k, _ in Scenario._node_steps(node))
+                plan.append((steps, key, dist_name, dist_cls, args, kwargs, shape, key_path))
+            else:
+                plan.append(None)
+
+        ret_val = self._draw(key, dist_cls, args, kwargs, shape)
+        episode_vals[key_path] = {
+                "value": ret_val,
+                "distribution": dist_name,
+            }
+        return ret_val
+
+    def _draw(self, key: str, dist_cls: type, args: tuple, kwargs: dict, shape: Any) -> Any:
+        """Sample the cached distribution for a resolver expression, creating it on first use."""
+        with self._sample_lock:
+            dist = self.dist_cache.get(key)
+            if dist is None:
+                dist = self.dist_cache[key] = dist_cls.create(self._generator, *args, size=shape, **kwargs)
+            ret_val = dist.sample()
+        ret_val = Scenario._convert_to_python(ret_val)
+
+        if isinstance(ret_val, list):
+            ret_val = ListConfig(ret_val)
+        return ret_val
 
-    def _clear_resolvers(self) -> None:
-        self.dist_cache.clear()
-        OmegaConf.clear_resolvers()
-    
     def resolve(self) -> tuple[DictConfig | ListConfig, dict]:
         """Resolve the scenario configuration, sampling all distributions.
 
         Returns:
             tuple[DictConfig | ListConfig, dict]: The resolved scenario and episode values.
         """
-        with self._lock:
-            cur_scenario = copy.deepcopy(self._scenario_template)
-            self._episode_vals = {}
+        # Each call samples into its own episode values, so only the draws themselves
+        # are serialized (see _sample_node)
+        cur_scenario = copy.deepcopy(self._scenario_template)
+        episode_vals = {}
+
+        # The first resolve records where each distribution node sits. When every
+        # distribution is a plain call, later resolves assign their samples directly in
+        # the same order, leaving OmegaConf only the remaining interpolations
+        plan = self._resolve_plan
+        targets = None if plan is None else Scenario._plan_targets(cur_scenario, plan)
+        if targets is not None:
+            for parent, (steps, key, dist_name, dist_cls, args, kwargs, shape, key_path) in zip(targets, plan):
+                ret_val = self._draw(key, dist_cls, args, kwargs, shape)
+                parent[steps[-1]] = ret_val
+                episode_vals[key_path] = {
+                    "value": ret_val,
+                    "distribution": dist_name,
+                }
+            recording = None
+        else:
+            recording = []
+
+        token = _ACTIVE_SCENARIO.set((self, episode_vals, recording))
+        try:
             OmegaConf.resolve(cur_scenario)
-            episode_vals = copy.deepcopy(self._episode_vals)
-            return cur_scenario, episode_vals
+        finally:
+            _ACTIVE_SCENARIO.reset(token)
+
+        if recording is not None:
+            # A node sampled more than once was reached through another node's
+            # interpolation before its own turn; direct assignment cannot replay that
+            plannable = (None not in recording
+                         and len({entry[0] for entry in recording}) == len(recording))
+            self._resolve_plan = tuple(recording) if plannable else None
+        return cur_scenario, episode_vals
+
+    @staticmethod
+    def _plan_targets(cur_scenario: DictConfig | ListConfig, plan: tuple) -> list | None:
+        """Find the parent container of every planned node in a fresh copy of the template.
+
+        Returns:
+            list | None: The parents in plan order, or None if any planned node no
+                longer holds its recorded expression (the template was modified).
+        """
+        targets = []
+        for steps, key, *_ in plan:
+            parent = cur_scenario
+            try:
+                for step in steps[:-1]:
+                    parent = parent._get_node(step)
+                node = parent._get_node(steps[-1])
+            except (AttributeError, IndexError, KeyError, TypeError):
+                return None
+            if node is None or str(node) != key:
+                return None
+            targets.append(parent)
+        return targets
 
     @property
     def scenario_id(self) -> str | None:
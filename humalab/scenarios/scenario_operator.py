@@ -3,7 +3,7 @@
 from typing import Optional
 from dataclasses import dataclass
 
-from humalab.humalab_api_client import HumaLabApiClient
+from humalab.humalab_api_client import get_api_client
 from humalab.scenarios.scenario import Scenario
 from humalab.constants import DEFAULT_PROJECT
 
@@ -57,9 +57,9 @@ def list_scenarios(project: str = DEFAULT_PROJECT,
     Returns:
         list[ScenarioMetadata]: A list of scenario metadata objects.
     """
-    api_client = HumaLabApiClient(base_url=base_url,
-                                  api_key=api_key,
-                                  timeout=timeout)
+    api_client = get_api_client(base_url=base_url,
+                                api_key=api_key,
+                                timeout=timeout)
     resp = api_client.get_scenarios(project_name=project,
                                     limit=limit,
                                     offset=offset,
@@ -88,6 +88,9 @@ def get_scenario(scenario_id: str,
                  timeout: float | None = None,) -> Scenario:
     """Retrieve and initialize a scenario from HumaLab.
 
+    Requests share a pooled API client per connection settings, and a specific
+    version is served from that client's response cache after the first fetch.
+
     Args:
         scenario_id (str): The unique identifier of the scenario.
         version (int | None): Optional specific version to retrieve.
@@ -100,9 +103,9 @@ def get_scenario(scenario_id: str,
     Returns:
         Scenario: The initialized scenario instance.
     """
-    api_client = HumaLabApiClient(base_url=base_url,
-                                  api_key=api_key,
-                                  timeout=timeout)
+    api_client = get_api_client(base_url=base_url,
+                                api_key=api_key,
+                                timeout=timeout)
     scenario_resp = api_client.get_scenario(
         project_name=project,
         uuid=scenario_id, version=version)
@@ -1,6 +1,9 @@
 import unittest
+from unittest.mock import patch
+import warnings
 import numpy as np
-from humalab.scenarios.scenario import Scenario
+from omegaconf import OmegaConf
+from humalab.scenarios.scenario import Scenario, _warn_extra_params
 
 
 class ScenarioTest(unittest.TestCase):
@@ -10,10 +13,6 @@ class ScenarioTest(unittest.TestCase):
         """Set up test fixtures before each test method."""
         self.scenario = Scenario()
 
-    def tearDown(self):
-        """Clean up after each test method."""
-        self.scenario._clear_resolvers()
-
     def test_init_should_initialize_with_empty_scenario(self):
         """Test that init() initializes with empty scenario when none provided."""
         # Pre-condition
@@ -88,10 +87,6 @@ class ScenarioTest(unittest.TestCase):
         # Post-condition
         self.assertEqual(value1, value2)
 
-        # Cleanup
-        scenario1._clear_resolvers()
-        scenario2._clear_resolvers()
-
     def test_uniform_distribution_should_resolve_correctly(self):
         """Test that uniform distribution resolver works correctly."""
         # Pre-condition
@@ -375,61 +370,49 @@ class ScenarioTest(unittest.TestCase):
             result = Scenario._convert_to_python(value)
             self.assertEqual(result, value)
 
-    def test_get_node_path_should_find_simple_key(self):
-        """Test _get_node_path with simple dictionary key."""
+    def test_node_key_path_should_build_simple_key(self):
+        """Test _node_key_path with simple dictionary key."""
         # Pre-condition
-        root = {"key1": "target_node", "key2": "other"}
-        self.scenario.init(
-            scenario={}
-        )
+        root = OmegaConf.create({"key1": "target_node", "key2": "other"})
 
         # In-test
-        path = self.scenario._get_node_path(root, "target_node")
+        path = Scenario._node_key_path(root._get_node("key1"))
 
         # Post-condition
         self.assertEqual(path, "key1")
 
-    def test_get_node_path_should_find_nested_key(self):
-        """Test _get_node_path with nested dictionary."""
+    def test_node_key_path_should_build_nested_key(self):
+        """Test _node_key_path with nested dictionary."""
         # Pre-condition
-        root = {"level1": {"level2": "target_node"}}
-        self.scenario.init(
-            scenario={}
-        )
+        root = OmegaConf.create({"level1": {"level2": "target_node"}})
 
         # In-test
-        path = self.scenario._get_node_path(root, "target_node")
+        path = Scenario._node_key_path(root.level1._get_node("level2"))
 
         # Post-condition
         self.assertEqual(path, "level1.level2")
 
-    def test_get_node_path_should_find_in_list(self):
-        """Test _get_node_path with list containing target."""
+    def test_node_key_path_should_bracket_list_index(self):
+        """Test _node_key_path with list containing target."""
         # Pre-condition
-        root = {"key": ["item1", "target_node", "item3"]}
-        self.scenario.init(
-            scenario={}
-        )
+        root = OmegaConf.create({"key": ["item1", "target_node", "item3"]})
 
         # In-test
-        path = self.scenario._get_node_path(root, "target_node")
+        path = Scenario._node_key_path(root.key._get_node(1))
 
         # Post-condition
         self.assertEqual(path, "key[1]")
 
-    def test_get_node_path_should_return_empty_for_missing_node(self):
-        """Test _get_node_path returns empty string when node not found."""
+    def test_node_key_path_should_restart_inside_bracketed_list(self):
+        """Test _node_key_path with a list nested directly inside a bracketed list."""
         # Pre-condition
-        root = {"key": "value"}
-        self.scenario.init(
-            scenario={}
-        )
+        root = OmegaConf.create({"key": [["item1", "target_node"]]})
 
         # In-test
-        path = self.scenario._get_node_path(root, "nonexistent")
+        path = Scenario._node_key_path(root.key[0]._get_node(1))
 
         # Post-condition
-        self.assertEqual(path, "")
+        self.assertEqual(path, "key[0].1")
 
     def test_template_property_should_return_scenario_template(self):
         """Test that template property returns the scenario template."""
@@ -497,6 +480,86 @@ class ScenarioTest(unittest.TestCase):
         # Verify episode_vals dict contains the distribution samples
         self.assertGreater(len(episode_vals), 0)
 
+    def test_extra_distribution_params_should_warn_once(self):
+        """Test that extra distribution parameters are ignored with a single warning."""
+        # Pre-condition
+        _warn_extra_params.cache_clear()
+        self.scenario.init(
+            scenario={"a": "${uniform: 0.0, 1.0, 5.0}", "b": "${uniform: 0.0, 1.0, 5.0}"},
+            seed=42
+        )
+
+        # In-test
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            resolved, _ = self.scenario.resolve()
+
+        # Post-condition
+        self.assertEqual(len(caught), 1)
+        self.assertIn("Too many parameters for uniform", str(caught[0].message))
+        self.assertLess(resolved.a, 1.0)
+
+    def test_resolve_should_key_episode_vals_by_node_path(self):
+        """Test that episode values are keyed by the path of each distribution node."""
+        # Pre-condition
+        scenario_config = {
+            "a": "${uniform: 0.0, 1.0}",
+            "b": {
+                "c": ["x", {"d": "${gaussian: 0.0, 1.0}"}, "${bernoulli: 0.5}"],
+            },
+            "l": [["${uniform: 0.0, 1.0}"]],
+        }
+        self.scenario.init(
+            scenario=scenario_config,
+            seed=42
+        )
+
+        # In-test
+        _, episode_vals = self.scenario.resolve()
+
+        # Post-condition
+        self.assertEqual(set(episode_vals), {"a", "b.c[1].d", "b.c[2]", "l[0].0"})
+
+    def test_repeated_resolve_should_match_full_resolve_for_forward_references(self):
+        """Test that repeated resolves sample like a full resolve when a node references a later one."""
+        # Pre-condition
+        scenario_config = {"b": "${a}", "a": "${uniform: 0.0, 1.0}", "c": "${uniform: 0.0, 1.0}"}
+        self.scenario.init(scenario=scenario_config, seed=7)
+        reference = Scenario()
+        reference.init(scenario=scenario_config, seed=7)
+
+        for _ in range(3):
+            # In-test
+            resolved, episode_vals = self.scenario.resolve()
+            reference._resolve_plan = None
+            expected, expected_vals = reference.resolve()
+
+            # Post-condition
+            self.assertEqual(dict(resolved), dict(expected))
+            self.assertEqual(episode_vals, expected_vals)
+            self.assertNotEqual(resolved.a, resolved.b)
+
+    def test_repeated_resolve_should_follow_template_changes(self):
+        """Test that resolving again samples every distribution, including ones added to the template."""
+        # Pre-condition
+        self.scenario.init(
+            scenario={"a": "${uniform: 0.0, 1.0}", "b": "${a}", "c": [1, 2]},
+            seed=42
+        )
+        first, _ = self.scenario.resolve()
+
+        # In-test
+        second, second_vals = self.scenario.resolve()
+        self.scenario.template.c.append("${uniform: 5.0, 6.0}")
+        third, third_vals = self.scenario.resolve()
+
+        # Post-condition
+        self.assertNotEqual(first.a, second.a)
+        self.assertEqual(second.a, second.b)
+        self.assertEqual(set(second_vals), {"a"})
+        self.assertEqual(set(third_vals), {"a", "c[2]"})
+        self.assertGreaterEqual(third.c[2], 5.0)
+
     def test_nested_scenario_access_should_work(self):
         """Test accessing deeply nested scenario values."""
         # Pre-condition
@@ -539,8 +602,8 @@ class ScenarioTest(unittest.TestCase):
         self.assertIsInstance(resolved.gaussian_val, (int, float))
         self.assertIn(resolved.bernoulli_val, [0, 1, True, False])
 
-    def test_clear_resolvers_should_clear_dist_cache(self):
-        """Test that _clear_resolvers clears the distribution cache."""
+    def test_init_should_clear_dist_cache(self):
+        """Test that re-initializing a scenario clears its distribution cache."""
         # Pre-condition
         scenario_config = {"value": "${uniform: 0.0, 1.0}"}
         self.scenario.init(
@@ -550,10 +613,26 @@ class ScenarioTest(unittest.TestCase):
         _ = self.scenario.resolve()  # Trigger cache population
 
         # In-test
-        self.scenario._clear_resolvers()
+        self.scenario.init(
+            scenario=scenario_config,
+            seed=42
+        )
+
+        # Post-condition
+        self.assertEqual(len(self.scenario.dist_cache), 0)
+
+    def test_init_should_register_resolvers_once(self):
+        """Test that distribution resolvers are registered once, not per scenario."""
+        # Pre-condition
+        self.scenario.init(scenario={})
+        self.assertTrue(OmegaConf.has_resolver("uniform"))
+
+        # In-test
+        with patch.object(OmegaConf, "register_new_resolver") as mock_register:
+            Scenario().init(scenario={})
 
         # Post-condition
-        self.assertEqual(len(Scenario.dist_cache), 0)
+        mock_register.assert_not_called()
 
     def test_main_script_scenario_should_initialize_with_nested_structure(self):
         """Test scenario initialization matching the __main__ script example."""
@@ -783,10 +862,6 @@ class ScenarioTest(unittest.TestCase):
         self.assertEqual(values1_x, values2_x)
         self.assertEqual(values1_y, values2_y)
 
-        # Cleanup
-        scenario1._clear_resolvers()
-        scenario2._clear_resolvers()
-
 
 if __name__ == "__main__":
     unittest.main()
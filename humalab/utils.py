@@ -1,4 +1,5 @@
 import builtins
+import pickle
 
 # Define what counts as "standard" types
 STANDARD_TYPES = (
@@ -34,4 +35,16 @@ def is_standard_type(obj, _seen=None):
     if isinstance(obj, type) and obj.__module__ == 'builtins':
         return True
 
-    return False
\ No newline at end of file
+    return False
+
+
+def pickle_artifact(obj) -> bytes:
+    """Pickle an artifact payload for upload using the highest available protocol.
+
+    Args:
+        obj: The object to pickle.
+
+    Returns:
+        bytes: The pickled object.
+    """
+    return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)